@@ -0,0 +1,38 @@
+"""add trigram indexes to arduino_devices search columns
+
+Revision ID: 20250603100000
+Revises: 20250522174500
+Create Date: 2025-06-03 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20250603100000'
+down_revision: Union[str, None] = '20250522174500'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Colunas filtradas com ILIKE '%termo%' na listagem de dispositivos
+SEARCH_COLUMNS = ('device_id', 'name', 'mac_address')
+
+
+def upgrade() -> None:
+    # Índices GIN de trigramas atendem ILIKE com curinga inicial, que um B-tree não atende
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f'ix_arduino_devices_{column}_trgm',
+            'arduino_devices',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f'ix_arduino_devices_{column}_trgm', table_name='arduino_devices')
@@ -0,0 +1,40 @@
+"""add covering indexes for arduino_devices listings
+
+Revision ID: 20250603110000
+Revises: 20250603100000
+Create Date: 2025-06-03 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20250603110000'
+down_revision: Union[str, None] = '20250603100000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Paginação por offset: ORDER BY name, id dentro do assinante
+    op.create_index(
+        'ix_arduino_devices_subscriber_name',
+        'arduino_devices',
+        ['subscriber_id', 'name', 'id'],
+        postgresql_include=['is_active']
+    )
+    # Paginação por cursor: ORDER BY created_at DESC, id DESC dentro do assinante
+    op.create_index(
+        'ix_arduino_devices_subscriber_created',
+        'arduino_devices',
+        ['subscriber_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_include=['is_active']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_arduino_devices_subscriber_created', table_name='arduino_devices')
+    op.drop_index('ix_arduino_devices_subscriber_name', table_name='arduino_devices')
@@ -0,0 +1,38 @@
+"""add check constraint for free plan modules price
+
+Revision ID: 20250603120000
+Revises: 20250603110000
+Create Date: 2025-06-03 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20250603120000'
+down_revision: Union[str, None] = '20250603110000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINT_NAME = 'ck_plan_modules_free_price'
+
+
+def upgrade() -> None:
+    # plan_modules é criada pelo create_all da aplicação; em bancos novos ela
+    # ainda não existe ou já nasce com a restrição declarada no modelo
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('plan_modules'):
+        return
+    if any(ck['name'] == CONSTRAINT_NAME for ck in inspector.get_check_constraints('plan_modules')):
+        return
+
+    # Módulos gratuitos gravados antes da restrição podem ter preço diferente de zero
+    op.execute('UPDATE plan_modules SET price = 0 WHERE is_free AND price <> 0')
+    op.create_check_constraint(CONSTRAINT_NAME, 'plan_modules', 'NOT is_free OR price = 0')
+
+
+def downgrade() -> None:
+    op.execute(f'ALTER TABLE plan_modules DROP CONSTRAINT IF EXISTS {CONSTRAINT_NAME}')
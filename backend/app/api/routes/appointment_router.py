@@ -5,7 +5,8 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user, get_db
@@ -31,6 +32,8 @@ router = APIRouter(
     responses={404: {"description": "Agendamento não encontrado"}}
 )
 
+_APPOINTMENT_LIST_ADAPTER = TypeAdapter(List[AppointmentResponse])
+
 
 def get_repository(db: Session = Depends(get_db)) -> IAppointmentRepository:
     """
@@ -75,7 +78,7 @@ async def create_appointment(
     try:
         use_case = CreateAppointmentUseCase(repository)
         subscriber_id = str(current_user.subscriber_id)
-        result = use_case.execute(appointment.dict(), UUID(subscriber_id))
+        result = use_case.execute(appointment.model_dump(), UUID(subscriber_id))
         return result
     except ValueError as e:
         raise HTTPException(
@@ -165,7 +168,7 @@ async def update_appointment(
     try:
         use_case = UpdateAppointmentUseCase(repository)
         subscriber_id = str(current_user.subscriber_id)
-        result = use_case.execute(appointment_id, appointment.dict(exclude_unset=True), UUID(subscriber_id))
+        result = use_case.execute(appointment_id, appointment.model_dump(exclude_unset=True), UUID(subscriber_id))
         return result
     except ValueError as e:
         if "não encontrado" in str(e):
@@ -282,7 +285,9 @@ async def list_appointments(
             provider_id=provider_id,
             status=status
         )
-        return result
+        # Validar e serializar a lista inteira em uma única chamada ao pydantic-core
+        items = _APPOINTMENT_LIST_ADAPTER.validate_python(result, from_attributes=True)
+        return Response(content=_APPOINTMENT_LIST_ADAPTER.dump_json(items), media_type="application/json")
     except Exception as e:
         raise HTTPException(
             status_code=500,
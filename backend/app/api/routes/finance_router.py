@@ -2,7 +2,7 @@ from uuid import UUID
 from datetime import date, datetime
 from typing import List, Dict, Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_db, get_current_user
@@ -108,7 +108,10 @@ async def list_payables(
             due_from=due_from,
             due_to=due_to
         )
-        return {"items": results, "total": len(results)}
+        result = PayableListResponse.model_validate(
+            {"items": results, "total": len(results)}, from_attributes=True
+        )
+        return Response(content=result.model_dump_json(), media_type="application/json")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -216,7 +219,10 @@ async def list_receivables(
             due_from=due_from,
             due_to=due_to
         )
-        return {"items": results, "total": len(results)}
+        result = ReceivableListResponse.model_validate(
+            {"items": results, "total": len(results)}, from_attributes=True
+        )
+        return Response(content=result.model_dump_json(), media_type="application/json")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -9,9 +9,18 @@ from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
-from app.db.models import User
+from app.db.models import User, UserRole
 from app.services.arduino_device_service import ArduinoDeviceService
-from app.schemas.arduino_device import ArduinoDeviceCreate, ArduinoDeviceUpdate, ArduinoDeviceResponse, PaginatedArduinoDeviceResponse
+from app.schemas.arduino_device import (
+    ArduinoDeviceBulkCreate,
+    ArduinoDeviceBulkCreateResponse,
+    ArduinoDeviceCreate,
+    ArduinoDeviceFilter,
+    ArduinoDeviceUpdate,
+    ArduinoDeviceResponse,
+    CursorPaginatedArduinoDeviceResponse
+)
+from app.schemas.common import paginated
 from app.core.dependencies import get_current_user, get_current_admin_or_director
 
 # Criar router
@@ -22,38 +31,59 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=PaginatedArduinoDeviceResponse)
-async def list_devices(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    skip: int = Query(0, ge=0, description="Quantos dispositivos pular"),
-    limit: int = Query(10, ge=1, le=100, description="Limite de dispositivos retornados"),
+def get_device_filters(
     device_id: Optional[str] = Query(None, description="Filtrar por ID do dispositivo"),
     name: Optional[str] = Query(None, description="Filtrar por nome"),
     mac_address: Optional[str] = Query(None, description="Filtrar por endereço MAC"),
     subscriber_id: Optional[UUID] = Query(None, description="Filtrar por assinante"),
     is_active: Optional[bool] = Query(None, description="Filtrar por status de ativação")
+) -> ArduinoDeviceFilter:
+    """
+    Dependência que reúne os filtros das listagens de dispositivos (valores vazios são ignorados)
+    """
+    return ArduinoDeviceFilter(
+        device_id=device_id or None,
+        name=name or None,
+        mac_address=mac_address or None,
+        subscriber_id=subscriber_id,
+        is_active=is_active
+    )
+
+
+@router.get("/", response_model=paginated(ArduinoDeviceResponse))
+def list_devices(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    skip: int = Query(0, ge=0, description="Quantos dispositivos pular"),
+    limit: int = Query(10, ge=1, le=100, description="Limite de dispositivos retornados"),
+    filters: ArduinoDeviceFilter = Depends(get_device_filters),
+    include_total: bool = Query(True, description="Incluir a contagem total de dispositivos")
 ):
     """
     Listar todos os dispositivos Arduino com opções de paginação e filtros.
     """
-    filter_params = {}
-    if device_id:
-        filter_params["device_id"] = device_id
-    if name:
-        filter_params["name"] = name
-    if mac_address:
-        filter_params["mac_address"] = mac_address
-    if subscriber_id:
-        filter_params["subscriber_id"] = subscriber_id
-    if is_active is not None:
-        filter_params["is_active"] = is_active
-        
-    return ArduinoDeviceService.get_devices(db, skip, limit, filter_params, current_user=current_user)
+    return ArduinoDeviceService.get_devices(
+        db, skip, limit, filters, current_user=current_user, include_total=include_total
+    )
+
+
+@router.get("/cursor", response_model=CursorPaginatedArduinoDeviceResponse)
+def list_devices_by_cursor(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="Cursor retornado na página anterior"),
+    limit: int = Query(10, ge=1, le=100, description="Limite de dispositivos retornados"),
+    filters: ArduinoDeviceFilter = Depends(get_device_filters)
+):
+    """
+    Listar dispositivos Arduino do mais recente para o mais antigo, paginando por cursor.
+    Sem contagem total; use o next_cursor da resposta para buscar a próxima página.
+    """
+    return ArduinoDeviceService.get_devices_by_cursor(db, limit, cursor, filters, current_user=current_user)
 
 
 @router.get("/{device_id}", response_model=ArduinoDeviceResponse)
-async def get_device(
+def get_device(
     device_id: UUID = Path(..., description="ID do dispositivo"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -71,20 +101,52 @@ async def get_device(
     return device
 
 
+def _scope_to_user_subscriber(device_data: ArduinoDeviceCreate, current_user: User) -> ArduinoDeviceCreate:
+    """
+    Vincula o dispositivo ao assinante do usuário, exceto para SUPER_ADMIN e DIRETOR
+    """
+    if current_user.role in [UserRole.SUPER_ADMIN, UserRole.DIRETOR]:
+        return device_data
+    
+    if not current_user.subscriber_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Usuário não vinculado a um assinante"
+        )
+    
+    return device_data.model_copy(update={"subscriber_id": current_user.subscriber_id})
+
+
 @router.post("/", response_model=ArduinoDeviceResponse, status_code=status.HTTP_201_CREATED)
-async def create_device(
+def create_device(
     device_data: ArduinoDeviceCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Criar um novo dispositivo Arduino.
+    Para usuários que não são SUPER_ADMIN ou DIRETOR, o dispositivo é sempre
+    vinculado ao assinante do próprio usuário.
+    """
+    return ArduinoDeviceService.create_device(db, _scope_to_user_subscriber(device_data, current_user))
+
+
+@router.post("/bulk", response_model=ArduinoDeviceBulkCreateResponse, status_code=status.HTTP_201_CREATED)
+def bulk_create_devices(
+    bulk_data: ArduinoDeviceBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_or_director)
+):
+    """
+    Criar vários dispositivos Arduino de uma vez (apenas SUPER_ADMIN e DIRETOR).
+    Dispositivos com device_id ou MAC já em uso são ignorados e listados em skipped.
     """
-    return ArduinoDeviceService.create_device(db, device_data)
+    created, skipped = ArduinoDeviceService.bulk_create_devices(db, bulk_data.devices)
+    return ArduinoDeviceBulkCreateResponse(created=created, skipped=skipped)
 
 
 @router.put("/{device_id}", response_model=ArduinoDeviceResponse)
-async def update_device(
+def update_device(
     device_data: ArduinoDeviceUpdate,
     device_id: UUID = Path(..., description="ID do dispositivo"),
     db: Session = Depends(get_db),
@@ -104,7 +166,7 @@ async def update_device(
 
 
 @router.delete("/{device_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_device(
+def delete_device(
     device_id: UUID = Path(..., description="ID do dispositivo"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -122,7 +184,7 @@ async def delete_device(
 
 
 @router.patch("/{device_id}/activate", response_model=ArduinoDeviceResponse)
-async def activate_device(
+def activate_device(
     device_id: UUID = Path(..., description="ID do dispositivo"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -141,7 +203,7 @@ async def activate_device(
 
 
 @router.patch("/{device_id}/deactivate", response_model=ArduinoDeviceResponse)
-async def deactivate_device(
+def deactivate_device(
     device_id: UUID = Path(..., description="ID do dispositivo"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
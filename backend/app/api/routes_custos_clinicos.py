@@ -56,15 +56,13 @@ async def list_custos_clinicos(
         date_to=date_to
     )
     
-    # Converter para o esquema de resposta
-    items = [CustoClinicalResponse.model_validate(entity.to_dict()) for entity in result["items"]]
-    
-    return CustoClinicalList(
-        items=items,
-        total=result["total"],
-        skip=result["skip"],
-        limit=result["limit"]
-    )
+    # Converter para o esquema de resposta (a lista é validada em uma única chamada)
+    return CustoClinicalList.model_validate({
+        "items": [entity.to_dict() for entity in result["items"]],
+        "total": result["total"],
+        "skip": result["skip"],
+        "limit": result["limit"]
+    })
 
 @router.get("/{custo_clinico_id}", response_model=CustoClinicalResponse)
 async def get_custo_clinico(
@@ -6,7 +6,8 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user
@@ -22,15 +23,34 @@ from app.infrastructure.repositories.insumo_repository import SQLAlchemyInsumoRe
 from app.schemas.insumo import (
     InsumoCreate,
     InsumoResponse,
+    InsumoListResponse,
     InsumoUpdate,
     InsumoEstoqueMovimento,
-    InsumoFilter
+    InsumoFilter,
+    TipoMovimento
+)
+from app.schemas.insumo_movimentacao import (
+    InsumoEstoqueHistoricoRequest,
+    InsumoMovimentacaoHistoricoResponse,
+    InsumoMovimentacaoListResponse
 )
-from app.schemas.insumo_movimentacao import InsumoEstoqueHistoricoRequest
 
 
 router = APIRouter(prefix="/insumos", tags=["insumos"])
 
+_INSUMO_LIST_ADAPTER = TypeAdapter(List[InsumoResponse])
+
+# Sugestões exibidas no formulário de novo insumo (os campos aceitam texto livre)
+CATEGORIAS_SUGERIDAS = (
+    "Medicamentos",
+    "Equipamentos",
+    "Materiais de Consumo",
+    "Produtos de Limpeza",
+    "Instrumentos",
+    "Outros"
+)
+UNIDADES_MEDIDA = ("UN", "KG", "G", "L", "ML", "M", "CM", "MM")
+
 
 @router.post("/", response_model=InsumoResponse)
 def create_insumo(
@@ -103,24 +123,8 @@ def get_novo_insumo_form(
     return {
         "action": "create",
         "subscriber_id": subscriber_id,
-        "categorias_sugeridas": [
-            "Medicamentos",
-            "Equipamentos",
-            "Materiais de Consumo",
-            "Produtos de Limpeza",
-            "Instrumentos",
-            "Outros"
-        ],
-        "unidades_medida": [
-            "UN",
-            "KG",
-            "G",
-            "L",
-            "ML",
-            "M",
-            "CM",
-            "MM"
-        ]
+        "categorias_sugeridas": CATEGORIAS_SUGERIDAS,
+        "unidades_medida": UNIDADES_MEDIDA
     }
 
 
@@ -156,7 +160,7 @@ def get_insumo(
     return insumo
 
 
-@router.get("/", response_model=Dict[str, Any])
+@router.get("/", response_model=InsumoListResponse)
 def list_insumos(
     skip: int = 0,
     limit: int = 100,
@@ -204,15 +208,13 @@ def list_insumos(
         **filters
     )
     
-    # Formatar resposta com paginação
-    result = {
-        "items": insumos[skip:skip+limit],
-        "total": len(insumos),
-        "skip": skip,
-        "limit": limit
-    }
-    
-    return result
+    # Validar e serializar os itens da página em uma única passada no
+    # pydantic-core; o envelope de paginação é montado em volta dos bytes
+    items = _INSUMO_LIST_ADAPTER.validate_python(insumos[skip:skip+limit], from_attributes=True)
+    content = b'{"items":%s,"total":%d,"skip":%d,"limit":%d}' % (
+        _INSUMO_LIST_ADAPTER.dump_json(items), len(insumos), skip, limit
+    )
+    return Response(content=content, media_type="application/json")
 
 
 @router.put("/{insumo_id}", response_model=InsumoResponse)
@@ -253,12 +255,8 @@ def update_insumo(
     # Criar caso de uso de atualização
     update_use_case = UpdateInsumoUseCase(repository)
     
-    # Preparar dados para atualização
-    update_data = insumo_data.dict(exclude_unset=True)
-    
-    # Converter lista de associações de módulos para dicionários se presente
-    if "modules_used" in update_data and update_data["modules_used"]:
-        update_data["modules_used"] = [module.dict() for module in update_data["modules_used"]]
+    # Preparar dados para atualização (as associações de módulos já saem como dicionários)
+    update_data = insumo_data.model_dump(exclude_unset=True)
     
     try:
         # Executar o caso de uso
@@ -375,12 +373,12 @@ def update_estoque(
         raise HTTPException(status_code=500, detail=f"Erro ao atualizar estoque: {str(e)}")
 
 
-@router.get("/{insumo_id}/movimentacoes", response_model=Dict[str, Any])
+@router.get("/{insumo_id}/movimentacoes", response_model=InsumoMovimentacaoHistoricoResponse)
 def get_movimentacoes_por_insumo(
     insumo_id: UUID,
     skip: int = Query(0, ge=0, description="Quantos registros pular"),
     limit: int = Query(100, ge=1, le=1000, description="Limite de registros a retornar"),
-    tipo_movimento: Optional[str] = Query(None, pattern=r'^(entrada|saida)$', description="Filtrar por tipo de movimento"),
+    tipo_movimento: Optional[TipoMovimento] = Query(None, description="Filtrar por tipo de movimento"),
     data_inicio: Optional[datetime] = Query(None, description="Data inicial para filtro"),
     data_fim: Optional[datetime] = Query(None, description="Data final para filtro"),
     db: Session = Depends(get_db),
@@ -453,12 +451,12 @@ def get_movimentacoes_por_insumo(
         raise HTTPException(status_code=500, detail=f"Erro ao obter histórico de movimentações: {str(e)}")
 
 
-@router.get("/movimentacoes", response_model=Dict[str, Any])
+@router.get("/movimentacoes", response_model=InsumoMovimentacaoListResponse)
 def get_todas_movimentacoes(
     skip: int = Query(0, ge=0, description="Quantos registros pular"),
     limit: int = Query(100, ge=1, le=1000, description="Limite de registros a retornar"),
     insumo_id: Optional[UUID] = Query(None, description="Filtrar por ID do insumo"),
-    tipo_movimento: Optional[str] = Query(None, pattern=r'^(entrada|saida)$', description="Filtrar por tipo de movimento"),
+    tipo_movimento: Optional[TipoMovimento] = Query(None, description="Filtrar por tipo de movimento"),
     data_inicio: Optional[datetime] = Query(None, description="Data inicial para filtro"),
     data_fim: Optional[datetime] = Query(None, description="Data final para filtro"),
     db: Session = Depends(get_db),
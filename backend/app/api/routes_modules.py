@@ -5,7 +5,7 @@ Rotas da API para gerenciamento de módulos funcionais
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Response
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -40,7 +40,8 @@ async def list_modules(
     if is_active is not None:
         filter_params["is_active"] = is_active
         
-    return ModuleService.get_modules(db, skip, limit, filter_params, current_user=current_user)
+    result = ModuleService.get_modules(db, skip, limit, filter_params, current_user=current_user)
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{module_id}", response_model=ModuleResponse)
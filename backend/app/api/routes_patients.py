@@ -4,7 +4,7 @@ Rotas da API para gerenciamento de pacientes no sistema HUBB ONE Assist
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Path, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Path, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user, get_db
@@ -84,14 +84,18 @@ async def list_patients(
             detail="Apenas usuários vinculados a um assinante podem listar pacientes"
         )
         
-    return PatientService.list_patients(
-        db=db,
-        subscriber_id=current_user.subscriber_id,
-        skip=skip,
-        limit=limit,
-        name=name,
-        cpf=cpf
+    result = PatientListResponse.model_validate(
+        PatientService.list_patients(
+            db=db,
+            subscriber_id=current_user.subscriber_id,
+            skip=skip,
+            limit=limit,
+            name=name,
+            cpf=cpf
+        ),
+        from_attributes=True
     )
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{patient_id}", response_model=PatientResponse)
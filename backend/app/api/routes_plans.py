@@ -5,7 +5,7 @@ Rotas da API para gerenciamento de planos
 from typing import Optional, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Response
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -46,7 +46,8 @@ async def list_plans(
     # Para planos, passamos o current_user para manter compatibilidade com a interface,
     # mas o filtro por subscriber_id não é aplicado no serviço por serem globais
     # No futuro, se necessário, essa estrutura permitirá fácil adaptação para planos por assinante
-    return PlanService.get_plans(db, skip, limit, filter_params, current_user=current_user)
+    result = PlanService.get_plans(db, skip, limit, filter_params, current_user=current_user)
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{plan_id}", response_model=PlanResponse)
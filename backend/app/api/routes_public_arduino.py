@@ -2,13 +2,21 @@
 Rotas públicas da API para criação de dispositivos Arduino sem autenticação
 """
 
+import logging
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.services.arduino_device_service import ArduinoDeviceService
-from app.schemas.arduino_device import PublicArduinoDeviceCreate, ArduinoDeviceResponse
+from app.schemas.arduino_device import (
+    ArduinoDeviceBulkCreateResponse,
+    ArduinoDeviceResponse,
+    PublicArduinoDeviceBulkCreate,
+    PublicArduinoDeviceCreate
+)
+
+logger = logging.getLogger(__name__)
 
 # Criar router para operações públicas
 router = APIRouter(
@@ -23,7 +31,7 @@ router = APIRouter(
 
 
 @router.post("/register", response_model=ArduinoDeviceResponse, status_code=status.HTTP_201_CREATED)
-async def register_arduino_device(
+def register_arduino_device(
     device_data: PublicArduinoDeviceCreate,
     db: Session = Depends(get_db)
 ):
@@ -74,8 +82,41 @@ async def register_arduino_device(
         )
 
 
+@router.post("/register/bulk", response_model=ArduinoDeviceBulkCreateResponse, status_code=status.HTTP_201_CREATED)
+def register_arduino_devices_bulk(
+    bulk_data: PublicArduinoDeviceBulkCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    Registra vários dispositivos Arduino de uma vez a partir do processo de ativação pública.
+    Dispositivos com device_id ou MAC já em uso são ignorados e listados em skipped.
+    
+    Args:
+        bulk_data: Dados dos novos dispositivos
+        db: Sessão do banco de dados
+        
+    Returns:
+        ArduinoDeviceBulkCreateResponse: Dispositivos criados e device_ids ignorados
+        
+    Raises:
+        HTTPException: Se algum assinante não for encontrado ou houver erro no registro
+    """
+    try:
+        created, skipped = ArduinoDeviceService.create_devices_public_bulk(db, bulk_data.devices)
+        return ArduinoDeviceBulkCreateResponse(created=created, skipped=skipped)
+        
+    except HTTPException as e:
+        raise e
+    except Exception:
+        logger.exception("Erro ao registrar dispositivos Arduino em lote")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro ao processar a solicitação. Por favor, tente novamente."
+        )
+
+
 @router.post("/connect", status_code=status.HTTP_200_OK)
-async def connect_arduino_device(
+def connect_arduino_device(
     device_id: str,
     mac_address: str,
     request: Request,
@@ -5,7 +5,7 @@ Rotas públicas da API para acesso aos planos sem autenticação
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Response
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -42,7 +42,8 @@ async def list_public_plans(
     if segment_id:
         filter_params["segment_id"] = segment_id
         
-    return PlanService.get_plans(db, skip, limit, filter_params)
+    result = PlanService.get_plans(db, skip, limit, filter_params)
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{plan_id}", response_model=PlanResponse)
@@ -3,7 +3,7 @@ Rotas públicas da API para acesso aos segmentos sem autenticação
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -39,7 +39,7 @@ async def list_public_segments(
             filter_params["nome"] = nome
         
         result = SegmentService.get_segments(db, skip, limit, filter_params)
-        return result
+        return Response(content=result.model_dump_json(), media_type="application/json")
         
     except Exception as e:
         print(f"[ERROR] Erro ao listar segmentos públicos: {str(e)}")
@@ -5,7 +5,7 @@ Rotas da API para gerenciamento de segmentos
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Path, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Path, Query, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -50,7 +50,7 @@ async def list_segments(
         result = SegmentService.get_segments(db, skip, limit, filter_params, current_user=current_user)
         print(f"[DEBUG] Segmentos encontrados: {len(result.items)}")
         
-        return result
+        return Response(content=result.model_dump_json(), media_type="application/json")
     except Exception as e:
         print(f"[ERROR] Erro ao listar segmentos: {str(e)}")
         raise
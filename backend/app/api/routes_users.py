@@ -46,7 +46,8 @@ async def list_users(
     if is_active is not None:
         filters["is_active"] = is_active
     
-    return UserService.get_users(db, skip=skip, limit=limit, filter_params=filters, current_user=current_user)
+    result = UserService.get_users(db, skip=skip, limit=limit, filter_params=filters, current_user=current_user)
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 @router.get("/me", response_model=None, status_code=status.HTTP_200_OK)
 async def get_current_user_info(
@@ -7,7 +7,7 @@ from datetime import datetime, date
 from enum import Enum as PyEnum
 from typing import Optional, List
 
-from sqlalchemy import Column, String, Boolean, DateTime, Enum, Integer, Text, Float, ForeignKey, Date
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, Integer, Text, Float, ForeignKey, Date, CheckConstraint, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, declarative_base
 
@@ -140,6 +140,11 @@ class PlanModule(Base):
     price = Column(Float, nullable=False, default=0.0)
     is_free = Column(Boolean, nullable=False, default=False)
     trial_days = Column(Integer, nullable=True)
+
+    # Módulos gratuitos não têm preço
+    __table_args__ = (
+        CheckConstraint('NOT is_free OR price = 0', name='ck_plan_modules_free_price'),
+    )
     
     # Relacionamentos
     plan = relationship("Plan")
@@ -205,11 +210,40 @@ class ArduinoDevice(Base):
     # Campos de auditoria
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Índices das listagens por assinante, na ordem usada por cada paginação;
+    # is_active fica no INCLUDE para que o filtro seja resolvido só no índice
+    __table_args__ = (
+        Index('ix_arduino_devices_subscriber_name', subscriber_id, name, id, postgresql_include=['is_active']),
+        Index(
+            'ix_arduino_devices_subscriber_created',
+            subscriber_id, created_at.desc(), id.desc(),
+            postgresql_include=['is_active']
+        ),
+        # Trigramas (pg_trgm) para os filtros ILIKE '%termo%' da busca
+        *(
+            Index(
+                f'ix_arduino_devices_{column}_trgm',
+                column,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'}
+            )
+            for column in ('device_id', 'name', 'mac_address')
+        ),
+    )
     
     def __repr__(self):
         return f"<ArduinoDevice {self.name} ({self.device_id})>"
 
 
+# Os índices de trigramas dependem da extensão pg_trgm quando a tabela é criada pelo create_all
+event.listen(
+    ArduinoDevice.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+
 class Patient(Base):
     """
     Modelo para pacientes no sistema, vinculados a assinantes.
@@ -23,10 +23,12 @@ if DATABASE_URL is None:
 # Configurar opções de conexão mais robustas para lidar com problemas de conexão
 engine_options = {
     "pool_pre_ping": True,  # Verificar a conexão antes de usar (detecta conexões quebradas)
-    "pool_recycle": 120,    # Reciclar conexões a cada 2 minutos para evitar timeouts
-    "pool_timeout": 30,     # Timeout para obter uma conexão do pool
-    "pool_size": 5,         # Tamanho padrão do pool de conexões
-    "max_overflow": 10,     # Número máximo de conexões extras além do pool_size
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),  # Reciclar conexões (segundos); o pre_ping já detecta as quebradas
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),    # Timeout para obter uma conexão do pool
+    # Os tamanhos do pool podem ser ajustados por ambiente; o padrão soma 50
+    # conexões por processo, metade do max_connections padrão do PostgreSQL
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),          # Tamanho padrão do pool de conexões
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "30")),    # Número máximo de conexões extras além do pool_size
     "connect_args": {       # Argumentos específicos para o driver psycopg2
         "connect_timeout": 10,  # Timeout de conexão em segundos
         "keepalives": 1,        # Ativar keepalives para detectar conexões quebradas
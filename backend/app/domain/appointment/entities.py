@@ -5,6 +5,10 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID, uuid4
 
+# Status aceitos para um agendamento (a ordem é usada na mensagem de erro)
+VALID_STATUSES = ("scheduled", "confirmed", "cancelled", "completed")
+_VALID_STATUS_SET = frozenset(VALID_STATUSES)
+
 
 class Appointment:
     """
@@ -74,9 +78,8 @@ class Appointment:
         if self.end_time <= self.start_time:
             raise ValueError("A data/hora de término deve ser posterior à data/hora de início")
         
-        valid_statuses = ["scheduled", "confirmed", "cancelled", "completed"]
-        if self.status not in valid_statuses:
-            raise ValueError(f"Status inválido. Valores aceitos: {', '.join(valid_statuses)}")
+        if self.status not in _VALID_STATUS_SET:
+            raise ValueError(f"Status inválido. Valores aceitos: {', '.join(VALID_STATUSES)}")
         
         if self.status == "cancelled" and self.is_active:
             raise ValueError("Um agendamento cancelado não deveria estar ativo")
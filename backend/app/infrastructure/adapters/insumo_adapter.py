@@ -2,6 +2,7 @@
 Adaptador para converter entre modelos de banco de dados e entidades de domínio para Insumos.
 """
 
+import sys
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
@@ -66,9 +67,11 @@ class InsumoAdapter:
             id=model.id,
             nome=model.nome,
             descricao=model.descricao,
-            categoria=model.categoria,
+            # Categoria e unidade se repetem entre os insumos: internadas, todas
+            # as entidades carregadas compartilham uma única string por valor
+            categoria=sys.intern(model.categoria),
             valor_unitario=model.valor_unitario,
-            unidade_medida=model.unidade_medida,
+            unidade_medida=sys.intern(model.unidade_medida),
             estoque_minimo=model.estoque_minimo,
             estoque_atual=model.estoque_atual,
             subscriber_id=model.subscriber_id,
@@ -27,7 +27,7 @@ class AnamnesisSQLAlchemyRepository(IAnamnesisRepository):
         Returns:
             AnamnesisEntity: Entidade de anamnese criada
         """
-        anamnesis_data = data.dict()
+        anamnesis_data = data.model_dump()
         
         # Criar modelo SQLAlchemy
         anamnesis_model = Anamnesis(
@@ -126,7 +126,7 @@ class AnamnesisSQLAlchemyRepository(IAnamnesisRepository):
             return None
             
         # Atualizar apenas campos não nulos
-        update_data = data.dict(exclude_unset=True)
+        update_data = data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(anamnesis_model, key, value)
             
@@ -1,6 +1,7 @@
 """
 Implementação SQLAlchemy do repositório de agendamentos
 """
+import sys
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
@@ -45,7 +46,9 @@ class AppointmentSQLAlchemyRepository(IAppointmentRepository):
             service_name=model.service_name,
             start_time=model.start_time,
             end_time=model.end_time,
-            status=model.status,
+            # Internado: as comparações de status com os literais do domínio
+            # passam a resolver pela identidade do objeto
+            status=sys.intern(model.status),
             notes=model.notes,
             is_active=model.is_active,
             created_at=model.created_at,
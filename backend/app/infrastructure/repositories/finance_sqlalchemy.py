@@ -3,7 +3,7 @@ from uuid import UUID
 from datetime import date
 from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from app.domain.finance.interfaces import IFinanceRepository
 from app.domain.finance.entities import (
@@ -49,7 +49,7 @@ class FinanceSQLAlchemyRepository(IFinanceRepository):
         inst = self.db.query(Payable).filter_by(id=id, subscriber_id=subscriber_id).first()
         if not inst:
             return None
-        for field, value in data.dict(exclude_unset=True).items():
+        for field, value in data.model_dump(exclude_unset=True).items():
             setattr(inst, field, value)
         self.db.commit()
         self.db.refresh(inst)
@@ -112,7 +112,7 @@ class FinanceSQLAlchemyRepository(IFinanceRepository):
         inst = self.db.query(Receivable).filter_by(id=id, subscriber_id=subscriber_id).first()
         if not inst:
             return None
-        for field, value in data.dict(exclude_unset=True).items():
+        for field, value in data.model_dump(exclude_unset=True).items():
             setattr(inst, field, value)
         self.db.commit()
         self.db.refresh(inst)
@@ -153,23 +153,24 @@ class FinanceSQLAlchemyRepository(IFinanceRepository):
         from_date: date,
         to_date: date,
     ) -> CashFlowSummary:
-        inflow = self.db.query(func.coalesce(func.sum(Receivable.amount), 0))
-        inflow = inflow.filter(
+        inflow = select(func.coalesce(func.sum(Receivable.amount), 0)).where(
             Receivable.subscriber_id == subscriber_id,
             Receivable.is_active == True,
             Receivable.received == True,
             Receivable.receive_date >= from_date,
             Receivable.receive_date <= to_date,
-        ).scalar()
+        ).scalar_subquery()
 
-        outflow = self.db.query(func.coalesce(func.sum(Payable.amount), 0))
-        outflow = outflow.filter(
+        outflow = select(func.coalesce(func.sum(Payable.amount), 0)).where(
             Payable.subscriber_id == subscriber_id,
             Payable.is_active == True,
             Payable.paid == True,
             Payable.payment_date >= from_date,
             Payable.payment_date <= to_date,
-        ).scalar()
+        ).scalar_subquery()
+
+        # As duas somas são calculadas em uma única ida ao banco
+        inflow, outflow = self.db.query(inflow, outflow).one()
 
         return CashFlowSummary(
             total_inflows=inflow,
@@ -184,41 +185,42 @@ class FinanceSQLAlchemyRepository(IFinanceRepository):
         period_to: date,
     ) -> ProfitCalculation:
         # Receita total baseada em recebíveis efetivos
-        total_revenue = self.db.query(func.coalesce(func.sum(Receivable.amount), 0))
-        total_revenue = total_revenue.filter(
+        total_revenue = select(func.coalesce(func.sum(Receivable.amount), 0)).where(
             Receivable.subscriber_id == subscriber_id,
             Receivable.is_active == True,
             Receivable.received == True,
             Receivable.receive_date >= period_from,
             Receivable.receive_date <= period_to,
-        ).scalar()
+        ).scalar_subquery()
 
         # Custos fixos
-        fixed = self.db.query(func.coalesce(func.sum(CostFixed.valor), 0))
-        fixed = fixed.filter(
+        fixed = select(func.coalesce(func.sum(CostFixed.valor), 0)).where(
             CostFixed.subscriber_id == subscriber_id,
             CostFixed.is_active == True,
             CostFixed.data >= period_from,
             CostFixed.data <= period_to,
-        ).scalar()
+        ).scalar_subquery()
 
         # Custos variáveis
-        variable = self.db.query(func.coalesce(func.sum(CostVariable.valor_unitario * CostVariable.quantidade), 0))
-        variable = variable.filter(
+        variable = select(func.coalesce(func.sum(CostVariable.valor_unitario * CostVariable.quantidade), 0)).where(
             CostVariable.subscriber_id == subscriber_id,
             CostVariable.is_active == True,
             CostVariable.data >= period_from,
             CostVariable.data <= period_to,
-        ).scalar()
+        ).scalar_subquery()
 
         # Custos clínicos
-        clinical = self.db.query(func.coalesce(func.sum(CostClinical.total_cost), 0))
-        clinical = clinical.filter(
+        clinical = select(func.coalesce(func.sum(CostClinical.total_cost), 0)).where(
             CostClinical.subscriber_id == subscriber_id,
             CostClinical.is_active == True,
             CostClinical.date >= period_from,
             CostClinical.date <= period_to,
-        ).scalar()
+        ).scalar_subquery()
+
+        # As quatro somas são calculadas em uma única ida ao banco
+        total_revenue, fixed, variable, clinical = self.db.query(
+            total_revenue, fixed, variable, clinical
+        ).one()
 
         total_costs = fixed + variable + clinical
         gross_profit = total_revenue - total_costs
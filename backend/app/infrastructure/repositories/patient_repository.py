@@ -56,7 +56,7 @@ class PatientSQLAlchemyRepository(PatientRepository):
             )
         
         # Criar novo paciente a partir dos dados do schema
-        patient_dict = patient_data.dict()
+        patient_dict = patient_data.model_dump()
         patient_dict["subscriber_id"] = subscriber_id
         
         # Criar modelo ORM
@@ -137,7 +137,7 @@ class PatientSQLAlchemyRepository(PatientRepository):
                 )
         
         # Atualizar apenas campos não-nulos
-        update_data = patient_data.dict(exclude_unset=True)
+        update_data = patient_data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             if hasattr(patient, key):
                 setattr(patient, key, value)
@@ -16,6 +16,8 @@ from app.db.session import engine, Base, get_db
 from app.db.models import User, Segment, Module, Plan, PlanModule, Subscriber
 from app.db.models_appointment import Appointment
 from app.services.user_service import UserService
+from app.schemas.arduino_device import PublicArduinoDeviceBulkCreate, PublicArduinoDeviceCreate
+from app.schemas.auth import RefreshTokenRequest
 from app.core.dependencies import get_current_user
 from app.api.routes_users import router as users_router
 from app.api.routes_segments import router as segments_router
@@ -213,7 +215,7 @@ async def external_api_subscribers_direct(
         return JSONResponse(
             status_code=200,
             content={
-                "items": [subscriber.model_dump() if hasattr(subscriber, 'model_dump') else subscriber.dict() for subscriber in result_dict.get("items", [])],
+                "items": [subscriber.model_dump() for subscriber in result_dict.get("items", [])],
                 "total": result_dict.get("total", 0),
                 "skip": result_dict.get("skip", skip),
                 "limit": result_dict.get("limit", limit)
@@ -604,6 +606,20 @@ export default API_CONFIG;
         media_type="application/javascript"
     )
 
+# Schemas declarados com defer_build=True: não pesam no import dos módulos,
+# mas são construídos no startup para não atrasar a primeira requisição
+DEFERRED_SCHEMAS = (PublicArduinoDeviceCreate, PublicArduinoDeviceBulkCreate, RefreshTokenRequest)
+
+
+@app.on_event("startup")
+async def build_deferred_schemas():
+    """
+    Constrói os validadores dos schemas com construção adiada.
+    """
+    for schema in DEFERRED_SCHEMAS:
+        schema.model_rebuild()
+
+
 # Inicialização do usuário admin padrão
 @app.on_event("startup")
 async def startup_event():
@@ -3,30 +3,29 @@ from datetime import datetime
 from uuid import UUID
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.schemas.common import READ_CONFIG
+
 
 class AnamnesisBase(BaseModel):
-    """Esquema base para anamnese"""
+    """
+    Esquema base para anamnese
+
+    Attributes:
+        chief_complaint: Queixa principal do paciente
+        medical_history: Histórico médico do paciente
+        allergies: Lista de alergias do paciente
+        medications: Medicamentos que o paciente está tomando atualmente
+        notes: Observações adicionais
+    """
     chief_complaint: str = Field(
         ..., 
         description="Queixa principal do paciente",
         min_length=3
     )
-    medical_history: Optional[str] = Field(
-        None, 
-        description="Histórico médico do paciente"
-    )
-    allergies: Optional[str] = Field(
-        None, 
-        description="Lista de alergias do paciente"
-    )
-    medications: Optional[str] = Field(
-        None, 
-        description="Medicamentos que o paciente está tomando atualmente"
-    )
-    notes: Optional[str] = Field(
-        None, 
-        description="Observações adicionais"
-    )
+    medical_history: Optional[str] = None
+    allergies: Optional[str] = None
+    medications: Optional[str] = None
+    notes: Optional[str] = None
 
 
 class AnamnesisCreate(AnamnesisBase):
@@ -35,28 +34,25 @@ class AnamnesisCreate(AnamnesisBase):
 
 
 class AnamnesisUpdate(BaseModel):
-    """Esquema para atualização de anamnese"""
+    """
+    Esquema para atualização de anamnese
+
+    Attributes:
+        chief_complaint: Queixa principal do paciente
+        medical_history: Histórico médico do paciente
+        allergies: Lista de alergias do paciente
+        medications: Medicamentos que o paciente está tomando atualmente
+        notes: Observações adicionais
+    """
     chief_complaint: Optional[str] = Field(
         None, 
         description="Queixa principal do paciente",
         min_length=3
     )
-    medical_history: Optional[str] = Field(
-        None, 
-        description="Histórico médico do paciente"
-    )
-    allergies: Optional[str] = Field(
-        None, 
-        description="Lista de alergias do paciente"
-    )
-    medications: Optional[str] = Field(
-        None, 
-        description="Medicamentos que o paciente está tomando atualmente"
-    )
-    notes: Optional[str] = Field(
-        None, 
-        description="Observações adicionais"
-    )
+    medical_history: Optional[str] = None
+    allergies: Optional[str] = None
+    medications: Optional[str] = None
+    notes: Optional[str] = None
     
     model_config = ConfigDict(extra="forbid")
 
@@ -70,13 +66,8 @@ class AnamnesisResponse(AnamnesisBase):
     created_at: datetime
     updated_at: datetime
     
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v)
-        }
-    )
+    # datetime e UUID já são serializados nativamente (ISO 8601 e string)
+    model_config = READ_CONFIG
 
 
 class AnamnesisListResponse(BaseModel):
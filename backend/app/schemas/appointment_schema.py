@@ -2,10 +2,15 @@
 Esquemas Pydantic para o módulo de Agendamentos
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.common import READ_CONFIG
+
+# Status aceitos para um agendamento
+AppointmentStatus = Literal["scheduled", "confirmed", "cancelled", "completed"]
 
 
 class AppointmentBase(BaseModel):
@@ -26,20 +31,29 @@ class AppointmentBase(BaseModel):
     service_name: str = Field(..., min_length=3, max_length=255)
     start_time: datetime
     end_time: datetime
-    status: str = Field(default="scheduled", pattern="^(scheduled|confirmed|cancelled|completed)$")
+    status: AppointmentStatus = "scheduled"
     notes: Optional[str] = None
+
+
+class AppointmentInput(AppointmentBase):
+    """
+    Modelo base para entrada de agendamentos
     
-    @validator("end_time")
-    def end_time_after_start_time(cls, v, values):
+    Valida o intervalo de horários na entrada, de modo que as respostas
+    (AppointmentResponse) repassem os valores do banco sem revalidá-los
+    """
+    
+    @model_validator(mode="after")
+    def end_time_after_start_time(self) -> "AppointmentInput":
         """
         Valida que a data/hora de término é posterior à data/hora de início
         """
-        if "start_time" in values and v <= values["start_time"]:
+        if self.end_time <= self.start_time:
             raise ValueError("A data/hora de término deve ser posterior à data/hora de início")
-        return v
+        return self
 
 
-class AppointmentCreate(AppointmentBase):
+class AppointmentCreate(AppointmentInput):
     """
     Modelo para criação de agendamentos
     """
@@ -60,22 +74,26 @@ class AppointmentUpdate(BaseModel):
     service_name: Optional[str] = Field(None, min_length=3, max_length=255)
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
-    status: Optional[str] = Field(None, pattern="^(scheduled|confirmed|cancelled|completed)$")
+    status: Optional[AppointmentStatus] = None
     notes: Optional[str] = None
     
-    @validator("end_time")
-    def end_time_after_start_time(cls, v, values):
+    @model_validator(mode="after")
+    def end_time_after_start_time(self) -> "AppointmentUpdate":
         """
         Valida que a data/hora de término é posterior à data/hora de início
         """
-        if v is not None and "start_time" in values and values["start_time"] is not None and v <= values["start_time"]:
+        if (
+            self.end_time is not None
+            and self.start_time is not None
+            and self.end_time <= self.start_time
+        ):
             raise ValueError("A data/hora de término deve ser posterior à data/hora de início")
-        return v
+        return self
 
 
-class AppointmentInDB(AppointmentBase):
+class AppointmentResponse(AppointmentBase):
     """
-    Modelo para agendamentos armazenados no banco
+    Modelo para resposta de agendamentos armazenados no banco
     
     Attributes:
         id: ID único do agendamento
@@ -90,12 +108,9 @@ class AppointmentInDB(AppointmentBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        orm_mode = True
+    model_config = READ_CONFIG
 
 
-class AppointmentResponse(AppointmentInDB):
-    """
-    Modelo para resposta de agendamentos
-    """
-    pass
\ No newline at end of file
+# Alias mantido para compatibilidade: evita declarar (e construir o schema de)
+# uma segunda classe idêntica a AppointmentResponse
+AppointmentInDB = AppointmentResponse
@@ -5,9 +5,52 @@ Esquemas Pydantic para dispositivos Arduino
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
-import re
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, IPvAnyAddress, field_validator, model_validator
+
+from app.schemas.common import ORM_CONFIG, ORM_UPDATE_CONFIG, CursorPaginatedResponse, paginated
+
+
+# Validação do MAC sem regex: formato fixo de 17 caracteres ASCII, com
+# separadores nas posições 2, 5, 8, 11 e 14 e dígitos hexadecimais no restante
+_MAC_LENGTH = 17
+_MAC_SEPARATOR_POSITIONS = (2, 5, 8, 11, 14)
+_MAC_HEX_POSITIONS = tuple(i for i in range(_MAC_LENGTH) if i not in _MAC_SEPARATOR_POSITIONS)
+_HEX = frozenset(b'0123456789abcdefABCDEF')
+_SEP = frozenset(b':-')
+# Depois de validado, o MAC só contém dígitos hexadecimais e separadores: uma
+# única tabela converte para maiúsculas e troca '-' por ':' em uma só passada
+_MAC_NORMALIZE = str.maketrans('abcdef-', 'ABCDEF:')
+_MAC_ERROR = "Endereço MAC inválido. Use o formato XX:XX:XX:XX:XX:XX ou XX-XX-XX-XX-XX-XX"
+
+
+def _is_valid_mac(v: str) -> bool:
+    """Verifica se o endereço MAC está no formato XX:XX:XX:XX:XX:XX ou XX-XX-XX-XX-XX-XX"""
+    if len(v) != _MAC_LENGTH or not v.isascii():
+        return False
+    b = v.encode('ascii')
+    return (
+        all(b[i] in _SEP for i in _MAC_SEPARATOR_POSITIONS)
+        and all(b[i] in _HEX for i in _MAC_HEX_POSITIONS)
+    )
+
+
+def _reject_duplicate_devices(devices: List["ArduinoDeviceInput"]) -> None:
+    """Rejeita lotes que repetem device_id ou MAC, já que o INSERT manteria apenas um deles"""
+    for field in ("device_id", "mac_address"):
+        seen = set()
+        for device in devices:
+            value = getattr(device, field)
+            if value in seen:
+                raise ValueError(f"{field} '{value}' repetido no lote")
+            seen.add(value)
+
+
+def _normalize_mac(v: str) -> str:
+    """Valida o endereço MAC e o converte para a forma canônica XX:XX:XX:XX:XX:XX"""
+    if not _is_valid_mac(v):
+        raise ValueError(_MAC_ERROR)
+    return v.translate(_MAC_NORMALIZE)
 
 
 class ArduinoDeviceBase(BaseModel):
@@ -18,22 +61,25 @@ class ArduinoDeviceBase(BaseModel):
     mac_address: str = Field(..., description="Endereço MAC do dispositivo")
     firmware_version: Optional[str] = Field(None, description="Versão do firmware")
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True
-    )
+    model_config = ORM_CONFIG
+
+
+class ArduinoDeviceInput(ArduinoDeviceBase):
+    """
+    Esquema base para entrada de dispositivos Arduino
+
+    Valida o MAC e o armazena na forma canônica, de modo que as respostas
+    (ArduinoDeviceResponse) repassem o valor do banco sem revalidá-lo
+    """
 
-    @field_validator('mac_address')
-    def validate_mac_address(cls, v):
-        """Valida o formato do endereço MAC"""
-        # Formato padrão XX:XX:XX:XX:XX:XX ou XX-XX-XX-XX-XX-XX
-        mac_pattern = r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$'
-        if not re.match(mac_pattern, v):
-            raise ValueError("Endereço MAC inválido. Use o formato XX:XX:XX:XX:XX:XX ou XX-XX-XX-XX-XX-XX")
-        return v
+    @field_validator('mac_address', mode='after')
+    @classmethod
+    def validate_mac_address(cls, v: str) -> str:
+        """Valida o formato do endereço MAC e normaliza para XX:XX:XX:XX:XX:XX"""
+        return _normalize_mac(v)
 
 
-class ArduinoDeviceCreate(ArduinoDeviceBase):
+class ArduinoDeviceCreate(ArduinoDeviceInput):
     """Esquema para criação de dispositivo Arduino"""
     subscriber_id: UUID = Field(..., description="ID do assinante ao qual o dispositivo pertence")
 
@@ -43,26 +89,19 @@ class ArduinoDeviceUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=3, max_length=100)
     description: Optional[str] = Field(None, max_length=255)
     mac_address: Optional[str] = None
-    ip_address: Optional[str] = None
+    ip_address: Optional[IPvAnyAddress] = None
     firmware_version: Optional[str] = None
     is_active: Optional[bool] = None
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True,
-        extra="forbid"  # impede campos extras
-    )
+    model_config = ORM_UPDATE_CONFIG
 
-    @field_validator('mac_address')
-    def validate_mac_address(cls, v):
-        """Valida o formato do endereço MAC"""
+    @field_validator('mac_address', mode='after')
+    @classmethod
+    def validate_mac_address(cls, v: Optional[str]) -> Optional[str]:
+        """Valida o formato do endereço MAC e normaliza para XX:XX:XX:XX:XX:XX"""
         if v is None:
             return v
-        # Formato padrão XX:XX:XX:XX:XX:XX ou XX-XX-XX-XX-XX-XX
-        mac_pattern = r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$'
-        if not re.match(mac_pattern, v):
-            raise ValueError("Endereço MAC inválido. Use o formato XX:XX:XX:XX:XX:XX ou XX-XX-XX-XX-XX-XX")
-        return v
+        return _normalize_mac(v)
 
 
 class ArduinoDeviceResponse(ArduinoDeviceBase):
@@ -75,34 +114,56 @@ class ArduinoDeviceResponse(ArduinoDeviceBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True
-    )
+    model_config = ORM_CONFIG
 
 
-class PaginatedArduinoDeviceResponse(BaseModel):
-    """Esquema para resposta paginada de dispositivos Arduino"""
-    total: int
-    page: int
-    size: int
-    items: List[ArduinoDeviceResponse]
+# Esquema para resposta paginada de dispositivos Arduino
+PaginatedArduinoDeviceResponse = paginated(ArduinoDeviceResponse)
+CursorPaginatedArduinoDeviceResponse = CursorPaginatedResponse[ArduinoDeviceResponse]
 
 
-class PublicArduinoDeviceCreate(BaseModel):
+class ArduinoDeviceFilter(BaseModel):
+    """Filtros das listagens de dispositivos Arduino"""
+    device_id: Optional[str] = None
+    name: Optional[str] = None
+    mac_address: Optional[str] = None
+    subscriber_id: Optional[UUID] = None
+    is_active: Optional[bool] = None
+
+
+class ArduinoDeviceBulkCreate(BaseModel):
+    """Esquema para criação de dispositivos Arduino em lote"""
+    devices: List[ArduinoDeviceCreate] = Field(..., min_length=1, max_length=500, description="Dispositivos a criar")
+
+    @model_validator(mode="after")
+    def unique_devices(self):
+        """Valida que device_id e MAC não se repetem no lote"""
+        _reject_duplicate_devices(self.devices)
+        return self
+
+
+class ArduinoDeviceBulkCreateResponse(BaseModel):
+    """Resultado da criação em lote - device_ids ignorados por já estarem em uso (device_id ou MAC)"""
+    created: List[ArduinoDeviceResponse]
+    skipped: List[str]
+
+
+class PublicArduinoDeviceCreate(ArduinoDeviceInput):
     """Esquema para criação pública de dispositivo Arduino durante registro"""
-    device_id: str = Field(..., min_length=3, max_length=50, description="ID único do dispositivo")
-    name: str = Field(..., min_length=3, max_length=100, description="Nome do dispositivo")
-    description: Optional[str] = Field(None, max_length=255, description="Descrição do dispositivo")
-    mac_address: str = Field(..., description="Endereço MAC do dispositivo")
-    firmware_version: Optional[str] = Field(None, description="Versão do firmware")
     subscriber_code: str = Field(..., description="Código do assinante para associação")
 
-    @field_validator('mac_address')
-    def validate_mac_address(cls, v):
-        """Valida o formato do endereço MAC"""
-        # Formato padrão XX:XX:XX:XX:XX:XX ou XX-XX-XX-XX-XX-XX
-        mac_pattern = r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$'
-        if not re.match(mac_pattern, v):
-            raise ValueError("Endereço MAC inválido. Use o formato XX:XX:XX:XX:XX:XX ou XX-XX-XX-XX-XX-XX")
-        return v
\ No newline at end of file
+    # Usado apenas no registro público: o schema só é construído no primeiro uso
+    model_config = ConfigDict(defer_build=True)
+
+
+class PublicArduinoDeviceBulkCreate(BaseModel):
+    """Esquema para criação pública de dispositivos Arduino em lote"""
+    devices: List[PublicArduinoDeviceCreate] = Field(..., min_length=1, max_length=500, description="Dispositivos a registrar")
+
+    @model_validator(mode="after")
+    def unique_devices(self):
+        """Valida que device_id e MAC não se repetem no lote"""
+        _reject_duplicate_devices(self.devices)
+        return self
+
+    model_config = ConfigDict(defer_build=True)
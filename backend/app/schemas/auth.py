@@ -2,15 +2,31 @@
 Schemas Pydantic para autenticação
 """
 
+import re
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+# Validação sintática simples para o login: o usuário existe no banco ou não,
+# então a validação completa do email-validator (IDNA, normalização Unicode)
+# fica restrita aos schemas de cadastro
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
 
 
 class LoginRequest(BaseModel):
     """Schema para requisição de login"""
-    email: EmailStr
+    email: str
     password: str = Field(..., min_length=8)
+
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        """Valida o formato do email e normaliza o domínio para minúsculas, como o EmailStr"""
+        if not _EMAIL_RE.fullmatch(v):
+            raise ValueError("Email inválido")
+        local, _, domain = v.rpartition('@')
+        return f"{local}@{domain.lower()}"
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -29,8 +45,14 @@ class Token(BaseModel):
     token_type: str = "bearer"
     
     
-class TokenData(BaseModel):
-    """Schema para dados extraídos do token"""
+@dataclass(slots=True, frozen=True)
+class TokenData:
+    """
+    Dados extraídos do token
+
+    Dataclass em vez de BaseModel: é instanciado a cada requisição autenticada
+    a partir do payload já verificado do JWT e nunca é validado nem serializado
+    """
     user_id: int
     email: Optional[str] = None
     role: Optional[str] = None
@@ -44,6 +66,8 @@ class RefreshTokenRequest(BaseModel):
     """Schema para requisição de refresh token"""
     refresh_token: str
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class DashboardTypeResponse(BaseModel):
     """Schema para resposta do tipo de dashboard"""
@@ -0,0 +1,75 @@
+"""
+Esquemas Pydantic compartilhados entre os módulos
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+from typing import Annotated, Generic, List, Optional, TypeVar
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, WithJsonSchema
+from pydantic.networks import validate_email
+
+T = TypeVar("T")
+
+# Configuração compartilhada pelos esquemas de resposta lidos do ORM
+READ_CONFIG = ConfigDict(from_attributes=True)
+
+# Configurações dos esquemas administrativos, que aceitam campos por nome ou alias
+ORM_CONFIG = ConfigDict(from_attributes=True, populate_by_name=True)
+ORM_UPDATE_CONFIG = ConfigDict(from_attributes=True, populate_by_name=True, extra="forbid")
+
+# Nome curto dos cadastros administrativos (módulos, planos, segmentos e usuários)
+Name = Annotated[str, Field(min_length=2, max_length=100)]
+
+# Valor monetário positivo, compatível com as colunas Numeric(12, 2)
+Money = Annotated[Decimal, Field(gt=0, max_digits=12, decimal_places=2)]
+
+
+@lru_cache(maxsize=4096)
+def _normalize_email(value: str) -> str:
+    """Valida o email como o EmailStr, memorizando o resultado por valor"""
+    return validate_email(value)[1]
+
+
+# Equivalente ao EmailStr; os mesmos emails voltam a cada listagem de usuários
+Email = Annotated[str, AfterValidator(_normalize_email), WithJsonSchema({"type": "string", "format": "email"})]
+
+
+class PaginatedResponse(BaseModel, Generic[T]):
+    """Esquema genérico para respostas paginadas (total é omitido quando a contagem não é solicitada)"""
+    total: Optional[int] = None
+    page: int
+    size: int
+    items: List[T]
+
+
+@lru_cache(maxsize=None)
+def paginated(item_model: type) -> type:
+    """
+    Retorna a especialização PaginatedResponse[item_model]
+
+    A especialização é memorizada para que todas as rotas que usam o mesmo
+    tipo de item compartilhem a mesma classe (e o mesmo validador/serializador)
+
+    Args:
+        item_model: Esquema dos itens da página
+
+    Returns:
+        type: Classe PaginatedResponse especializada
+    """
+    return PaginatedResponse[item_model]
+
+
+class OffsetPaginatedResponse(BaseModel, Generic[T]):
+    """Esquema genérico para respostas paginadas por skip/limit"""
+    items: List[T]
+    total: int
+    skip: int
+    limit: int
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Esquema genérico para respostas paginadas por cursor"""
+    size: int
+    items: List[T]
+    next_cursor: Optional[str] = None
@@ -2,41 +2,25 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional, List, Any
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+from app.schemas.common import READ_CONFIG, OffsetPaginatedResponse
 
 class CostFixedBase(BaseModel):
     nome: str = Field(..., min_length=1, max_length=255)
-    valor: Decimal = Field(..., gt=0, lt=1000000000)
+    valor: Decimal = Field(..., gt=0, lt=1000000000, decimal_places=2)
     data: date
     observacoes: Optional[str] = None
-    
-    @field_validator('valor')
-    @classmethod
-    def validate_valor(cls, v: Decimal) -> Decimal:
-        # Garante que o valor tenha no máximo 2 casas decimais
-        if v.quantize(Decimal('0.01')) != v:
-            raise ValueError('O valor deve ter no máximo 2 casas decimais')
-        return v
 
 class CostFixedCreate(CostFixedBase):
     pass
 
 class CostFixedUpdate(BaseModel):
     nome: Optional[str] = Field(None, min_length=1, max_length=255)
-    valor: Optional[Decimal] = Field(None, gt=0, lt=1000000000)
+    valor: Optional[Decimal] = Field(None, gt=0, lt=1000000000, decimal_places=2)
     data: Optional[date] = None
     observacoes: Optional[str] = None
     is_active: Optional[bool] = None
-    
-    @field_validator('valor')
-    @classmethod
-    def validate_valor(cls, v: Optional[Decimal]) -> Optional[Decimal]:
-        if v is None:
-            return None
-        # Garante que o valor tenha no máximo 2 casas decimais
-        if v.quantize(Decimal('0.01')) != v:
-            raise ValueError('O valor deve ter no máximo 2 casas decimais')
-        return v
 
 class CostFixedInDB(CostFixedBase):
     id: UUID
@@ -45,25 +29,20 @@ class CostFixedInDB(CostFixedBase):
     created_at: datetime
     updated_at: datetime
     
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 class CostFixedResponse(CostFixedInDB):
     pass
 
-class CostFixedListResponse(BaseModel):
-    items: List[CostFixedResponse]
-    total: int
-    skip: int
-    limit: int
-    
+class CostFixedListResponse(OffsetPaginatedResponse[CostFixedResponse]):
     @classmethod
     def from_entities(cls, entities: List[Any], total: int, skip: int, limit: int):
         """
         Cria uma resposta de lista a partir de uma lista de entidades.
         """
-        return cls(
-            items=[CostFixedResponse.model_validate(entity.__dict__) for entity in entities],
-            total=total,
-            skip=skip,
-            limit=limit
-        )
\ No newline at end of file
+        return cls.model_validate({
+            "items": [entity.__dict__ for entity in entities],
+            "total": total,
+            "skip": skip,
+            "limit": limit
+        })
\ No newline at end of file
@@ -2,23 +2,17 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional, List, Any
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, computed_field
+
+from app.schemas.common import READ_CONFIG, Money, OffsetPaginatedResponse
 
 class CustoVariavelBase(BaseModel):
     """Esquema base para custos variáveis."""
     nome: str = Field(..., min_length=1, max_length=255)
-    valor_unitario: Decimal = Field(..., gt=0)
+    valor_unitario: Money
     quantidade: int = Field(..., gt=0)
     data: date
     observacoes: Optional[str] = None
-    
-    @field_validator('valor_unitario')
-    @classmethod
-    def validate_valor_unitario(cls, v: Decimal) -> Decimal:
-        """Valida que o valor unitário tenha no máximo 2 casas decimais."""
-        if v.quantize(Decimal('0.01')) != v:
-            raise ValueError('O valor unitário deve ter no máximo 2 casas decimais')
-        return v
 
 class CustoVariavelCreate(CustoVariavelBase):
     """Esquema para criação de custos variáveis."""
@@ -27,21 +21,11 @@ class CustoVariavelCreate(CustoVariavelBase):
 class CustoVariavelUpdate(BaseModel):
     """Esquema para atualização de custos variáveis."""
     nome: Optional[str] = Field(None, min_length=1, max_length=255)
-    valor_unitario: Optional[Decimal] = Field(None, gt=0)
+    valor_unitario: Optional[Money] = None
     quantidade: Optional[int] = Field(None, gt=0)
     data: Optional[date] = None
     observacoes: Optional[str] = None
     is_active: Optional[bool] = None
-    
-    @field_validator('valor_unitario')
-    @classmethod
-    def validate_valor_unitario(cls, v: Optional[Decimal]) -> Optional[Decimal]:
-        """Valida que o valor unitário tenha no máximo 2 casas decimais."""
-        if v is None:
-            return v
-        if v.quantize(Decimal('0.01')) != v:
-            raise ValueError('O valor unitário deve ter no máximo 2 casas decimais')
-        return v
 
 class CustoVariavelInDB(CustoVariavelBase):
     """Esquema para representação de custos variáveis no banco de dados."""
@@ -51,16 +35,16 @@ class CustoVariavelInDB(CustoVariavelBase):
     created_at: datetime
     updated_at: datetime
     
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 class CustoVariavelResponse(CustoVariavelInDB):
     """Esquema para resposta de custos variáveis."""
-    # Valor total calculado (valor_unitario * quantidade)
-    valor_total: Decimal = Field(...)
 
-class CustoVariavelList(BaseModel):
-    """Esquema para lista paginada de custos variáveis."""
-    items: List[CustoVariavelResponse]
-    total: int
-    skip: int
-    limit: int
\ No newline at end of file
+    @computed_field
+    @property
+    def valor_total(self) -> Decimal:
+        """Valor total calculado (valor_unitario * quantidade)."""
+        return self.valor_unitario * self.quantidade
+
+# Esquema para lista paginada de custos variáveis.
+CustoVariavelList = OffsetPaginatedResponse[CustoVariavelResponse]
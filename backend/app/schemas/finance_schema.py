@@ -1,12 +1,18 @@
-from pydantic import BaseModel, Field, condecimal
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import date, datetime
-from typing import Optional, List
+from decimal import Decimal
+from typing import Annotated, Optional, List
+
+from app.schemas.common import READ_CONFIG, Money
+
+# Totais calculados (podem ser zero ou negativos) com no máximo 2 casas decimais
+Amount = Annotated[Decimal, Field(decimal_places=2)]
 
 # --- PAYABLES ---
 class PayableBase(BaseModel):
     description: str = Field(..., min_length=3, max_length=255)
-    amount: condecimal(gt=0, decimal_places=2)
+    amount: Money
     due_date: date
     notes: Optional[str] = None
 
@@ -15,30 +21,29 @@ class PayableCreate(PayableBase):
 
 class PayableUpdate(BaseModel):
     description: Optional[str] = Field(None, min_length=3, max_length=255)
-    amount: Optional[condecimal(gt=0, decimal_places=2)]
-    due_date: Optional[date]
-    paid: Optional[bool]
-    payment_date: Optional[datetime]
-    notes: Optional[str]
-    is_active: Optional[bool]
+    amount: Optional[Money] = None
+    due_date: Optional[date] = None
+    paid: Optional[bool] = None
+    payment_date: Optional[datetime] = None
+    notes: Optional[str] = None
+    is_active: Optional[bool] = None
 
 class PayableResponse(PayableBase):
     id: UUID
     subscriber_id: UUID
     paid: bool
-    payment_date: Optional[datetime]
+    payment_date: Optional[datetime] = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = READ_CONFIG
 
 # --- RECEIVABLES ---
 class ReceivableBase(BaseModel):
     patient_id: UUID
     description: str = Field(..., min_length=3, max_length=255)
-    amount: condecimal(gt=0, decimal_places=2)
+    amount: Money
     due_date: date
     notes: Optional[str] = None
 
@@ -46,38 +51,37 @@ class ReceivableCreate(ReceivableBase):
     pass
 
 class ReceivableUpdate(BaseModel):
-    patient_id: Optional[UUID]
+    patient_id: Optional[UUID] = None
     description: Optional[str] = Field(None, min_length=3, max_length=255)
-    amount: Optional[condecimal(gt=0, decimal_places=2)]
-    due_date: Optional[date]
-    received: Optional[bool]
-    receive_date: Optional[datetime]
-    notes: Optional[str]
-    is_active: Optional[bool]
+    amount: Optional[Money] = None
+    due_date: Optional[date] = None
+    received: Optional[bool] = None
+    receive_date: Optional[datetime] = None
+    notes: Optional[str] = None
+    is_active: Optional[bool] = None
 
 class ReceivableResponse(ReceivableBase):
     id: UUID
     subscriber_id: UUID
     received: bool
-    receive_date: Optional[datetime]
+    receive_date: Optional[datetime] = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = READ_CONFIG
 
 # --- CASH FLOW & PROFIT ---
 class CashFlowSummary(BaseModel):
-    total_inflows: condecimal(decimal_places=2)
-    total_outflows: condecimal(decimal_places=2)
-    net_flow: condecimal(decimal_places=2)
+    total_inflows: Amount
+    total_outflows: Amount
+    net_flow: Amount
 
 class ProfitCalculation(BaseModel):
-    total_revenue: condecimal(decimal_places=2)
-    total_costs: condecimal(decimal_places=2)
-    gross_profit: condecimal(decimal_places=2)
-    net_profit: condecimal(decimal_places=2)
+    total_revenue: Amount
+    total_costs: Amount
+    gross_profit: Amount
+    net_profit: Amount
 
 # --- LIST RESPONSES ---
 class PayableListResponse(BaseModel):
@@ -100,5 +104,5 @@ class FinanceFilterParams(BaseModel):
     date_from: Optional[date] = None
     date_to: Optional[date] = None
     paid_status: Optional[bool] = None 
-    min_amount: Optional[condecimal(decimal_places=2)] = None
-    max_amount: Optional[condecimal(decimal_places=2)] = None
\ No newline at end of file
+    min_amount: Optional[Amount] = None
+    max_amount: Optional[Amount] = None
\ No newline at end of file
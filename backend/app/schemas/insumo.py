@@ -3,11 +3,16 @@ Esquemas Pydantic para validação de dados na API de Insumos.
 """
 
 from datetime import datetime
-from typing import List, Optional, ClassVar
+from typing import List, Literal, Optional, ClassVar
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.schemas.common import READ_CONFIG, Money, OffsetPaginatedResponse
+
+# Tipos de movimentação de estoque
+TipoMovimento = Literal["entrada", "saida"]
+
 class ModuloAssociationBase(BaseModel):
     """
     Esquema base para associação entre Insumo e Módulo.
@@ -17,9 +22,7 @@ class ModuloAssociationBase(BaseModel):
     observacao: Optional[str] = None
     module_nome: Optional[str] = None
 
-    model_config = {
-        "from_attributes": True
-    }
+    model_config = READ_CONFIG
 
 
 class ModuloAssociationCreate(ModuloAssociationBase):
@@ -36,14 +39,38 @@ class ModuloAssociationResponse(ModuloAssociationBase):
     pass
 
 
-class InsumoBase(BaseModel):
+class InsumoInput(BaseModel):
+    """
+    Esquema base para entrada de Insumo (criação e atualização).
+
+    Concentra as validações das datas, que não se aplicam às respostas.
+    """
+
+    @field_validator('data_validade', check_fields=False)
+    @classmethod
+    def data_validade_futuro(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """Valida se a data de validade é futura"""
+        if v and v < datetime.utcnow():
+            raise ValueError("Data de validade deve ser futura")
+        return v
+
+    @field_validator('data_compra', check_fields=False)
+    @classmethod
+    def data_compra_passado(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """Valida se a data de compra é passada"""
+        if v and v > datetime.utcnow():
+            raise ValueError("Data de compra não pode ser futura")
+        return v
+
+
+class InsumoBase(InsumoInput):
     """
     Esquema base para Insumo com campos comuns.
     """
     nome: str = Field(..., min_length=1, max_length=100, description="Nome do insumo")
     descricao: str = Field(..., min_length=1, description="Descrição detalhada do insumo")
     categoria: str = Field(..., min_length=1, max_length=50, description="Categoria do insumo")
-    valor_unitario: float = Field(..., gt=0, description="Valor unitário do insumo", alias="precoUnitario")
+    valor_unitario: Money = Field(..., description="Valor unitário do insumo", alias="precoUnitario")
     unidade_medida: str = Field(..., min_length=1, max_length=20, description="Unidade de medida", alias="unidade")
     estoque_minimo: int = Field(..., ge=0, description="Estoque mínimo recomendado", alias="quantidadeMinimaAlerta")
     estoque_atual: int = Field(..., ge=0, description="Quantidade atual em estoque", alias="quantidadeAtual")
@@ -54,20 +81,6 @@ class InsumoBase(BaseModel):
     observacoes: Optional[str] = Field(None, description="Observações adicionais")
     modules_used: List[ModuloAssociationCreate] = Field(default_factory=list, description="Módulos associados ao insumo")
 
-    @field_validator('data_validade')
-    def data_validade_futuro(cls, v: Optional[datetime]) -> Optional[datetime]:
-        """Valida se a data de validade é futura"""
-        if v and v < datetime.utcnow():
-            raise ValueError("Data de validade deve ser futura")
-        return v
-
-    @field_validator('data_compra')
-    def data_compra_passado(cls, v: Optional[datetime]) -> Optional[datetime]:
-        """Valida se a data de compra é passada"""
-        if v and v > datetime.utcnow():
-            raise ValueError("Data de compra não pode ser futura")
-        return v
-
 
 class InsumoCreate(InsumoBase):
     """
@@ -76,7 +89,7 @@ class InsumoCreate(InsumoBase):
     subscriber_id: UUID = Field(..., description="ID do assinante (multitenant)")
 
 
-class InsumoUpdate(BaseModel):
+class InsumoUpdate(InsumoInput):
     """
     Esquema para atualização de um Insumo existente.
     
@@ -85,7 +98,7 @@ class InsumoUpdate(BaseModel):
     nome: Optional[str] = Field(None, min_length=1, max_length=100, description="Nome do insumo")
     descricao: Optional[str] = Field(None, min_length=1, description="Descrição detalhada do insumo")
     categoria: Optional[str] = Field(None, min_length=1, max_length=50, description="Categoria do insumo")
-    valor_unitario: Optional[float] = Field(None, gt=0, description="Valor unitário do insumo", alias="precoUnitario")
+    valor_unitario: Optional[Money] = Field(None, description="Valor unitário do insumo", alias="precoUnitario")
     unidade_medida: Optional[str] = Field(None, min_length=1, max_length=20, description="Unidade de medida", alias="unidade")
     estoque_minimo: Optional[int] = Field(None, ge=0, description="Estoque mínimo recomendado", alias="quantidadeMinimaAlerta")
     estoque_atual: Optional[int] = Field(None, ge=0, description="Quantidade atual em estoque", alias="quantidadeAtual")
@@ -96,20 +109,6 @@ class InsumoUpdate(BaseModel):
     observacoes: Optional[str] = Field(None, description="Observações adicionais")
     modules_used: Optional[List[ModuloAssociationCreate]] = None
 
-    @field_validator('data_validade')
-    def data_validade_futuro(cls, v: Optional[datetime]) -> Optional[datetime]:
-        """Valida se a data de validade é futura"""
-        if v and v < datetime.utcnow():
-            raise ValueError("Data de validade deve ser futura")
-        return v
-
-    @field_validator('data_compra')
-    def data_compra_passado(cls, v: Optional[datetime]) -> Optional[datetime]:
-        """Valida se a data de compra é passada"""
-        if v and v > datetime.utcnow():
-            raise ValueError("Data de compra não pode ser futura")
-        return v
-
 
 class InsumoResponse(BaseModel):
     """
@@ -145,9 +144,11 @@ class InsumoResponse(BaseModel):
         description="Indica se o insumo está expirado"
     )
 
-    model_config = {
-        "from_attributes": True
-    }
+    model_config = READ_CONFIG
+
+
+# Esquema para resposta paginada de insumos
+InsumoListResponse = OffsetPaginatedResponse[InsumoResponse]
 
 
 class InsumoEstoqueMovimento(BaseModel):
@@ -155,7 +156,7 @@ class InsumoEstoqueMovimento(BaseModel):
     Esquema para movimentação de estoque (entrada ou saída).
     """
     quantidade: int = Field(..., gt=0, description="Quantidade a ser adicionada ou removida")
-    tipo_movimento: str = Field(..., pattern=r'^(entrada|saida)$', description="Tipo de movimento: 'entrada' ou 'saida'")
+    tipo_movimento: TipoMovimento = Field(..., description="Tipo de movimento: 'entrada' ou 'saida'")
     motivo: Optional[str] = Field(None, max_length=255, description="Motivo da movimentação (ex: compra, venda, ajuste)")
     observacao: Optional[str] = Field(None, description="Observações adicionais sobre a movimentação")
 
@@ -6,7 +6,10 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.common import READ_CONFIG, OffsetPaginatedResponse
+from app.schemas.insumo import TipoMovimento
 
 
 class InsumoMovimentacaoBase(BaseModel):
@@ -14,7 +17,7 @@ class InsumoMovimentacaoBase(BaseModel):
     Esquema base para Movimentação de Estoque com campos comuns.
     """
     quantidade: int = Field(..., gt=0, description="Quantidade movimentada (sempre positiva)")
-    tipo_movimento: str = Field(..., pattern=r'^(entrada|saida)$', description="Tipo de movimento: 'entrada' ou 'saida'")
+    tipo_movimento: TipoMovimento = Field(..., description="Tipo de movimento: 'entrada' ou 'saida'")
     motivo: Optional[str] = Field(None, max_length=255, description="Motivo da movimentação")
     observacao: Optional[str] = Field(None, description="Observações adicionais")
 
@@ -24,13 +27,6 @@ class InsumoMovimentacaoCreate(InsumoMovimentacaoBase):
     Esquema para criação de uma nova Movimentação de Estoque.
     """
     insumo_id: UUID = Field(..., description="ID do insumo")
-    
-    @field_validator('quantidade')
-    def quantidade_positiva(cls, v: int) -> int:
-        """Valida se a quantidade é positiva"""
-        if v <= 0:
-            raise ValueError("Quantidade deve ser maior que zero")
-        return v
 
 
 class InsumoMovimentacaoUpdate(BaseModel):
@@ -68,9 +64,31 @@ class InsumoMovimentacaoResponse(BaseModel):
     insumo_unidade_medida: Optional[str] = None
     usuario_nome: Optional[str] = None
 
-    model_config = {
-        "from_attributes": True
-    }
+    model_config = READ_CONFIG
+
+
+# Esquema para resposta paginada do histórico de movimentações
+InsumoMovimentacaoListResponse = OffsetPaginatedResponse[InsumoMovimentacaoResponse]
+
+
+class InsumoResumo(BaseModel):
+    """
+    Dados do insumo retornados junto ao seu histórico de movimentações.
+    """
+    id: UUID
+    nome: str
+    estoque_atual: int
+    estoque_minimo: int
+    unidade_medida: str
+
+    model_config = READ_CONFIG
+
+
+class InsumoMovimentacaoHistoricoResponse(InsumoMovimentacaoListResponse):
+    """
+    Esquema para o histórico paginado de movimentações de um insumo.
+    """
+    insumo: InsumoResumo
 
 
 class InsumoEstoqueHistoricoRequest(BaseModel):
@@ -78,13 +96,13 @@ class InsumoEstoqueHistoricoRequest(BaseModel):
     Esquema para filtragem do histórico de movimentações.
     """
     insumo_id: Optional[UUID] = Field(None, description="Filtrar por ID do insumo")
-    tipo_movimento: Optional[str] = Field(None, pattern=r'^(entrada|saida)$', description="Filtrar por tipo de movimento")
+    tipo_movimento: Optional[TipoMovimento] = Field(None, description="Filtrar por tipo de movimento")
     data_inicio: Optional[datetime] = Field(None, description="Data inicial para filtro")
     data_fim: Optional[datetime] = Field(None, description="Data final para filtro")
     
-    @field_validator('data_fim')
-    def data_fim_maior_que_inicio(cls, v: Optional[datetime], values) -> Optional[datetime]:
+    @model_validator(mode="after")
+    def data_fim_maior_que_inicio(self):
         """Valida se a data final é posterior à data inicial, se ambas forem fornecidas"""
-        if v and 'data_inicio' in values and values['data_inicio'] and v < values['data_inicio']:
+        if self.data_inicio and self.data_fim and self.data_fim < self.data_inicio:
             raise ValueError("Data final deve ser posterior à data inicial")
-        return v
\ No newline at end of file
+        return self
\ No newline at end of file
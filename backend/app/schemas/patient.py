@@ -7,6 +7,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import READ_CONFIG
+
 
 class PatientBase(BaseModel):
     """
@@ -57,20 +59,6 @@ class PatientUpdate(BaseModel):
     is_active: Optional[bool] = Field(None, description="Status de ativação do paciente")
 
 
-class PatientInDB(PatientBase):
-    """
-    Schema que inclui campos somente disponíveis do banco de dados
-    """
-    id: UUID
-    subscriber_id: UUID
-    is_active: bool = True
-    created_at: date
-    updated_at: date
-
-    class Config:
-        orm_mode = True
-
-
 class PatientResponse(PatientBase):
     """
     Schema para resposta da API com as informações do paciente
@@ -78,8 +66,7 @@ class PatientResponse(PatientBase):
     id: UUID
     is_active: bool = True
 
-    class Config:
-        orm_mode = True
+    model_config = READ_CONFIG
 
 
 class PatientListResponse(BaseModel):
@@ -92,5 +79,4 @@ class PatientListResponse(BaseModel):
     size: int
     pages: int
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = READ_CONFIG
\ No newline at end of file
@@ -6,7 +6,9 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, Field, validator, ConfigDict
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.common import READ_CONFIG
 
 
 class ReportTypeEnum(str, Enum):
@@ -29,14 +31,14 @@ class RelatorioCustosBase(BaseModel):
     title: str = Field(..., description="Título do relatório")
     description: Optional[str] = Field(None, description="Descrição detalhada do relatório")
     
-    @validator('date_to')
-    def date_to_after_date_from(cls, v, values):
+    @model_validator(mode="after")
+    def date_to_after_date_from(self) -> "RelatorioCustosBase":
         """
         Valida que a data final é posterior à data inicial
         """
-        if 'date_from' in values and v < values['date_from']:
+        if self.date_to < self.date_from:
             raise ValueError('A data final deve ser posterior à data inicial')
-        return v
+        return self
 
 
 class RelatorioCustosCreate(RelatorioCustosBase):
@@ -57,14 +59,14 @@ class RelatorioCustosUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     
-    @validator('date_to')
-    def date_to_after_date_from(cls, v, values):
+    @model_validator(mode="after")
+    def date_to_after_date_from(self) -> "RelatorioCustosUpdate":
         """
         Valida que a data final é posterior à data inicial
         """
-        if v and 'date_from' in values and values['date_from'] and v < values['date_from']:
+        if self.date_to and self.date_from and self.date_to < self.date_from:
             raise ValueError('A data final deve ser posterior à data inicial')
-        return v
+        return self
 
 
 class RelatorioCustosResponse(RelatorioCustosBase):
@@ -82,7 +84,7 @@ class RelatorioCustosResponse(RelatorioCustosBase):
     created_at: date
     updated_at: date
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = READ_CONFIG
 
 
 class RelatorioCustosList(BaseModel):
@@ -6,19 +6,18 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel
+
+from app.schemas.common import ORM_CONFIG, ORM_UPDATE_CONFIG, Name
 
 
 class SegmentBase(BaseModel):
     """Schema base para segmentos com atributos comuns"""
-    nome: str = Field(..., min_length=2, max_length=100)
+    nome: Name
     descricao: Optional[str] = None
     is_active: Optional[bool] = True
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True
-    )
+    model_config = ORM_CONFIG
 
 
 class SegmentCreate(SegmentBase):
@@ -28,15 +27,11 @@ class SegmentCreate(SegmentBase):
 
 class SegmentUpdate(BaseModel):
     """Schema para atualização de segmento - todos os campos são opcionais"""
-    nome: Optional[str] = Field(None, min_length=2, max_length=100)
+    nome: Optional[Name] = None
     descricao: Optional[str] = None
     is_active: Optional[bool] = None
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True,
-        extra="forbid"  # impede campos extras
-    )
+    model_config = ORM_UPDATE_CONFIG
 
 
 class SegmentResponse(SegmentBase):
@@ -45,10 +40,7 @@ class SegmentResponse(SegmentBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True
-    )
+    model_config = ORM_CONFIG
 
 
 class PaginatedSegmentResponse(BaseModel):
@@ -1,11 +1,25 @@
 """
 Esquemas Pydantic para validação de dados de assinantes.
 """
+import re
 from datetime import datetime
 from typing import Optional, List, Union
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, validator, HttpUrl
+from pydantic import BaseModel, Field, field_validator, HttpUrl
+
+from app.schemas.common import READ_CONFIG, Email
+
+_NON_DIGITS_RE = re.compile(r'[^0-9]+')
+
+
+def _validate_cnpj(v: str) -> str:
+    """Verifica se o CNPJ tem 14 dígitos, ignorando a pontuação"""
+    # Aqui poderíamos adicionar uma validação mais complexa do CNPJ
+    # como verificação de dígitos verificadores, etc.
+    if len(_NON_DIGITS_RE.sub('', v)) != 14:
+        raise ValueError('CNPJ deve conter 14 dígitos numéricos')
+    return v
 
 
 class SubscriberBase(BaseModel):
@@ -13,7 +27,7 @@ class SubscriberBase(BaseModel):
     name: str = Field(..., min_length=3, max_length=255, description="Nome da empresa/assinante")
     fantasy_name: Optional[str] = Field(None, max_length=255, description="Nome fantasia")
     cnpj: Optional[str] = Field(None, max_length=18, description="CNPJ do assinante (formato: XX.XXX.XXX/XXXX-XX)")
-    contact_email: Optional[EmailStr] = Field(None, description="Email de contato")
+    contact_email: Optional[Email] = Field(None, description="Email de contato")
     contact_phone: Optional[str] = Field(None, max_length=20, description="Telefone de contato")
     logo_url: Optional[HttpUrl] = Field(None, description="URL para o logo da empresa")
     address: Optional[str] = Field(None, max_length=500, description="Endereço completo")
@@ -21,23 +35,13 @@ class SubscriberBase(BaseModel):
     modules: Optional[List[str]] = Field(None, description="Lista de IDs dos módulos contratados")
     plans: Optional[List[str]] = Field(None, description="Lista de IDs dos planos contratados")
 
-    @validator('cnpj')
+    @field_validator('cnpj')
+    @classmethod
     def validate_cnpj(cls, v):
         """Valida o formato do CNPJ."""
         if v is None:
             return v
-        
-        # Remove caracteres não numéricos para validação
-        numbers = ''.join(filter(str.isdigit, v))
-        
-        # Verifica se tem 14 dígitos
-        if len(numbers) != 14:
-            raise ValueError('CNPJ deve conter 14 dígitos numéricos')
-        
-        # Aqui poderíamos adicionar uma validação mais complexa do CNPJ
-        # como verificação de dígitos verificadores, etc.
-        
-        return v
+        return _validate_cnpj(v)
 
 
 class SubscriberCreate(SubscriberBase):
@@ -51,7 +55,7 @@ class SubscriberUpdate(BaseModel):
     fantasy_name: Optional[str] = Field(None, max_length=255, description="Nome fantasia")
     cnpj: Optional[str] = Field(None, max_length=18, description="CNPJ do assinante")
     active_until: Optional[datetime] = Field(None, description="Data até quando o assinante estará ativo")
-    contact_email: Optional[EmailStr] = Field(None, description="Email de contato")
+    contact_email: Optional[Email] = Field(None, description="Email de contato")
     contact_phone: Optional[str] = Field(None, max_length=20, description="Telefone de contato")
     logo_url: Optional[HttpUrl] = Field(None, description="URL para o logo da empresa")
     address: Optional[str] = Field(None, max_length=500, description="Endereço completo")
@@ -60,20 +64,13 @@ class SubscriberUpdate(BaseModel):
     plans: Optional[List[str]] = Field(None, description="Lista de IDs dos planos contratados")
     is_active: Optional[bool] = Field(None, description="Status de ativação do assinante")
 
-    @validator('cnpj')
+    @field_validator('cnpj')
+    @classmethod
     def validate_cnpj(cls, v):
         """Valida o formato do CNPJ."""
         if v is None:
             return v
-        
-        # Remove caracteres não numéricos para validação
-        numbers = ''.join(filter(str.isdigit, v))
-        
-        # Verifica se tem 14 dígitos
-        if len(numbers) != 14:
-            raise ValueError('CNPJ deve conter 14 dígitos numéricos')
-        
-        return v
+        return _validate_cnpj(v)
 
 
 class SubscriberInDB(SubscriberBase):
@@ -84,9 +81,7 @@ class SubscriberInDB(SubscriberBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Configuração para conversão ORM."""
-        from_attributes = True
+    model_config = READ_CONFIG
 
 
 class SubscriberResponse(SubscriberInDB):
@@ -5,21 +5,19 @@ Schemas Pydantic para usuários
 from datetime import datetime
 from typing import Optional, List, Union
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, Field
 
 from app.db.models import UserRole
+from app.schemas.common import ORM_CONFIG, ORM_UPDATE_CONFIG, Name, Email
 
 # Schemas Base para Usuário
 class UserBase(BaseModel):
     """Schema base para usuários com atributos comuns"""
-    name: str = Field(..., min_length=2, max_length=100)
-    email: EmailStr
+    name: Name
+    email: Email
     is_active: Optional[bool] = True
     
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True
-    )
+    model_config = ORM_CONFIG
 
 # Schema para criação de usuário
 class UserCreate(UserBase):
@@ -31,18 +29,14 @@ class UserCreate(UserBase):
 # Schema para atualização de usuário
 class UserUpdate(BaseModel):
     """Schema para atualização de usuário - todos os campos são opcionais"""
-    name: Optional[str] = Field(None, min_length=2, max_length=100)
-    email: Optional[EmailStr] = None
+    name: Optional[Name] = None
+    email: Optional[Email] = None
     password: Optional[str] = Field(None, min_length=8)
     role: Optional[UserRole] = None
     is_active: Optional[bool] = None
     subscriber_id: Optional[str] = None  # ID do assinante associado, opcional para administradores
     
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True,
-        extra="forbid"  # impede campos extras
-    )
+    model_config = ORM_UPDATE_CONFIG
 
 # Schema para resposta de usuário
 class UserResponse(UserBase):
@@ -53,10 +47,7 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True
-    )
+    model_config = ORM_CONFIG
 
 # Schema para lista paginada de usuários
 class PaginatedUserResponse(BaseModel):
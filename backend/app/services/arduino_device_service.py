@@ -2,22 +2,182 @@
 Serviço para operações CRUD de dispositivos Arduino
 """
 
+import base64
+import binascii
+import threading
+import time
 import uuid
-from typing import Optional, Dict, Any, List, TYPE_CHECKING, Union
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING, Union
 from datetime import datetime
 
 from fastapi import HTTPException, status
-from sqlalchemy import or_, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, and_, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, raiseload
 
 from app.db.models import ArduinoDevice, Subscriber, User, UserRole
-from app.schemas.arduino_device import ArduinoDeviceCreate, ArduinoDeviceUpdate, PaginatedArduinoDeviceResponse
+from app.schemas.arduino_device import (
+    ArduinoDeviceCreate,
+    ArduinoDeviceFilter,
+    ArduinoDeviceUpdate,
+    CursorPaginatedArduinoDeviceResponse,
+    PaginatedArduinoDeviceResponse,
+    PublicArduinoDeviceCreate
+)
 from app.core.dependencies import apply_subscriber_filter
 
 if TYPE_CHECKING:
     from app.db.models import User
 
 
+# Tamanho máximo de página, o mesmo limite aplicado pelas rotas
+MAX_PAGE_SIZE = 100
+
+# Campos de ArduinoDeviceFilter aplicados como busca parcial (ILIKE)
+_SEARCH_FIELDS = frozenset({"device_id", "name", "mac_address"})
+
+# Horário atual em UTC calculado pelo banco, no mesmo formato sem fuso das
+# colunas DateTime preenchidas com datetime.utcnow
+_DB_UTC_NOW = func.timezone("utc", func.now())
+
+# Cache por processo dos assinantes ativos resolvidos no cadastro de dispositivos,
+# por ID ou documento: chave -> (ID do assinante, instante de expiração). As rotas
+# rodam no threadpool, então todo acesso ao dicionário é feito sob o lock
+_SUBSCRIBER_CACHE_TTL = 60
+_SUBSCRIBER_CACHE_MAX_SIZE = 4096
+_subscriber_cache: Dict[Any, Tuple[uuid.UUID, float]] = {}
+_subscriber_cache_lock = threading.Lock()
+
+
+def _get_cached_subscriber_id(key: Any) -> Optional[uuid.UUID]:
+    """Retorna o ID do assinante em cache para a chave, se ainda válido"""
+    with _subscriber_cache_lock:
+        entry = _subscriber_cache.get(key)
+        if entry is None:
+            return None
+        subscriber_id, expires_at = entry
+        if expires_at < time.monotonic():
+            del _subscriber_cache[key]
+            return None
+        return subscriber_id
+
+
+def _cache_subscriber_id(key: Any, subscriber_id: uuid.UUID) -> None:
+    """Guarda o ID do assinante ativo, descartando a entrada mais antiga se o cache estiver cheio"""
+    with _subscriber_cache_lock:
+        if key not in _subscriber_cache and len(_subscriber_cache) >= _SUBSCRIBER_CACHE_MAX_SIZE:
+            del _subscriber_cache[next(iter(_subscriber_cache))]
+        _subscriber_cache[key] = (subscriber_id, time.monotonic() + _SUBSCRIBER_CACHE_TTL)
+
+
+def _forget_subscriber(subscriber_id: uuid.UUID) -> None:
+    """Remove do cache todas as entradas que apontam para o assinante"""
+    with _subscriber_cache_lock:
+        for key in [key for key, (cached_id, _) in _subscriber_cache.items() if cached_id == subscriber_id]:
+            del _subscriber_cache[key]
+
+
+def clear_subscriber_cache() -> None:
+    """Invalida o cache de assinantes (chamado quando um assinante é alterado ou desativado)"""
+    with _subscriber_cache_lock:
+        _subscriber_cache.clear()
+
+
+def _encode_cursor(device: ArduinoDevice) -> str:
+    """Codifica a posição (created_at, id) de um dispositivo como cursor opaco"""
+    raw = f"{device.created_at.isoformat()}|{device.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decodifica um cursor gerado por _encode_cursor"""
+    try:
+        created_at, device_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(device_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginação inválido"
+        )
+
+
+def _constraint_name(e: IntegrityError) -> str:
+    """Nome da restrição violada informado pelo driver (vazio se indisponível)"""
+    return getattr(getattr(e.orig, "diag", None), "constraint_name", None) or ""
+
+
+def _insert_device(db: Session, device: ArduinoDevice) -> None:
+    """
+    Grava um novo dispositivo, convertendo violações dos índices únicos de
+    device_id e mac_address em HTTP 409 e a chave estrangeira do assinante
+    (assinante removido após ser validado pelo cache) em HTTP 404
+
+    Após o INSERT o dispositivo já tem todas as colunas (os padrões são gerados
+    no Python); ele é desanexado antes do commit para dispensar o refresh
+    """
+    db.add(device)
+    try:
+        db.flush()
+    except IntegrityError as e:
+        db.rollback()
+        constraint = _constraint_name(e)
+        if "subscriber_id" in constraint:
+            _forget_subscriber(device.subscriber_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Assinante não encontrado ou inativo"
+            )
+        if "device_id" in constraint:
+            detail = f"ID de dispositivo '{device.device_id}' já está em uso"
+        elif "mac_address" in constraint:
+            detail = f"Endereço MAC '{device.mac_address}' já está em uso"
+        else:
+            raise
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+    db.expunge(device)
+    db.commit()
+
+
+def _insert_devices(db: Session, rows: List[Dict[str, Any]]) -> Tuple[List[ArduinoDevice], List[str]]:
+    """
+    Insere vários dispositivos em um único INSERT ... ON CONFLICT DO NOTHING RETURNING
+
+    Retorna os dispositivos criados e os device_ids ignorados por conflito de
+    device_id ou MAC com dispositivos já cadastrados; os esquemas de lote
+    rejeitam repetições dentro do próprio lote, então cada device_id identifica
+    uma única linha
+    """
+    stmt = pg_insert(ArduinoDevice).values(rows).on_conflict_do_nothing().returning(ArduinoDevice)
+    created = db.scalars(stmt).all()
+    
+    # Os dispositivos já trazem todas as colunas; desanexá-los evita um SELECT por item após o commit
+    for device in created:
+        db.expunge(device)
+    db.commit()
+    
+    created_ids = {device.device_id for device in created}
+    skipped = [row["device_id"] for row in rows if row["device_id"] not in created_ids]
+    
+    return created, skipped
+
+
+def _execute_update(db: Session, stmt) -> Optional[ArduinoDevice]:
+    """
+    Executa um UPDATE ... RETURNING e confirma a transação
+
+    O dispositivo retornado já traz todas as colunas; ele é desanexado da
+    sessão antes do commit para que o expire_on_commit não gere um novo SELECT
+    """
+    device = db.execute(
+        stmt.returning(ArduinoDevice).execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    if device is not None:
+        db.expunge(device)
+    db.commit()
+    return device
+
+
 class ArduinoDeviceService:
     """
     Serviço para operações relacionadas a dispositivos Arduino
@@ -29,8 +189,9 @@ class ArduinoDeviceService:
         db: Session, 
         skip: int = 0, 
         limit: int = 100,
-        filter_params: Optional[Dict[str, Any]] = None,
-        current_user: Optional["User"] = None
+        filter_params: Optional[ArduinoDeviceFilter] = None,
+        current_user: Optional["User"] = None,
+        include_total: bool = True
     ) -> PaginatedArduinoDeviceResponse:
         """
         Retorna uma lista paginada de dispositivos Arduino com opção de filtros
@@ -38,59 +199,129 @@ class ArduinoDeviceService:
         Args:
             db: Sessão do banco de dados
             skip: Número de registros para pular (paginação)
-            limit: Número máximo de registros para retornar (paginação)
+            limit: Número máximo de registros para retornar (paginação, até MAX_PAGE_SIZE)
             filter_params: Parâmetros para filtragem (opcional)
             current_user: Usuário autenticado (para aplicar filtro por subscriber_id)
+            include_total: Se False, não executa o COUNT e retorna total None
             
         Returns:
             PaginatedArduinoDeviceResponse: Lista paginada de dispositivos
         """
-        query = db.query(ArduinoDevice)
-        total_query = db.query(ArduinoDevice)
-        
-        # Aplicar filtros baseados no usuário logado
-        if current_user:
-            query = apply_subscriber_filter(query, current_user, ArduinoDevice)
-            total_query = apply_subscriber_filter(total_query, current_user, ArduinoDevice)
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        query = ArduinoDeviceService._filtered_query(db, filter_params, current_user)
+        
+        # Contagem total, quando solicitada, derivada da mesma consulta filtrada;
+        # um COUNT direto evita o subselect com todas as colunas gerado por query.count()
+        total = (
+            query.with_entities(func.count(ArduinoDevice.id)).order_by(None).scalar()
+            if include_total else None
+        )
         
-        # Aplicar filtros adicionais
-        if filter_params:
-            if "device_id" in filter_params:
-                query = query.filter(ArduinoDevice.device_id.ilike(f"%{filter_params['device_id']}%"))
-                total_query = total_query.filter(ArduinoDevice.device_id.ilike(f"%{filter_params['device_id']}%"))
-                
-            if "name" in filter_params:
-                query = query.filter(ArduinoDevice.name.ilike(f"%{filter_params['name']}%"))
-                total_query = total_query.filter(ArduinoDevice.name.ilike(f"%{filter_params['name']}%"))
-                
-            if "mac_address" in filter_params:
-                query = query.filter(ArduinoDevice.mac_address.ilike(f"%{filter_params['mac_address']}%"))
-                total_query = total_query.filter(ArduinoDevice.mac_address.ilike(f"%{filter_params['mac_address']}%"))
-                
-            if "subscriber_id" in filter_params:
-                query = query.filter(ArduinoDevice.subscriber_id == filter_params['subscriber_id'])
-                total_query = total_query.filter(ArduinoDevice.subscriber_id == filter_params['subscriber_id'])
-                
-            if "is_active" in filter_params:
-                query = query.filter(ArduinoDevice.is_active == filter_params['is_active'])
-                total_query = total_query.filter(ArduinoDevice.is_active == filter_params['is_active'])
-        
-        # Contagem total
-        total = total_query.count()
-        
-        # Consulta paginada
-        query = query.order_by(ArduinoDevice.name)
-        query = query.offset(skip).limit(limit)
-        devices = query.all()
+        # Consulta paginada com junção adiada: o offset percorre apenas os ids
+        # e as linhas completas são carregadas só para os itens da página.
+        # A resposta só usa colunas; raiseload impede carregamentos N+1 acidentais
+        page_ids = (
+            query.with_entities(ArduinoDevice.id)
+            .order_by(ArduinoDevice.name, ArduinoDevice.id)
+            .offset(skip)
+            .limit(limit)
+            .subquery()
+        )
+        devices = (
+            db.query(ArduinoDevice)
+            .options(raiseload("*"))
+            .join(page_ids, ArduinoDevice.id == page_ids.c.id)
+            .order_by(ArduinoDevice.name, ArduinoDevice.id)
+            .all()
+        )
         
         # Construir resposta paginada
         return PaginatedArduinoDeviceResponse(
             total=total,
-            page=skip // limit + 1 if limit else 1,
+            page=skip // limit + 1,
             size=limit,
             items=devices
         )
     
+    @staticmethod
+    def get_devices_by_cursor(
+        db: Session,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filter_params: Optional[ArduinoDeviceFilter] = None,
+        current_user: Optional["User"] = None
+    ) -> CursorPaginatedArduinoDeviceResponse:
+        """
+        Retorna uma página de dispositivos Arduino paginada por cursor
+        
+        Os dispositivos são ordenados do mais recente para o mais antigo por
+        (created_at, id); o cursor marca o último item da página anterior, de
+        modo que a consulta usa um WHERE em vez de OFFSET e não executa COUNT
+        
+        Args:
+            db: Sessão do banco de dados
+            limit: Número máximo de registros para retornar (até MAX_PAGE_SIZE)
+            cursor: Cursor retornado na página anterior (opcional)
+            filter_params: Parâmetros para filtragem (opcional)
+            current_user: Usuário autenticado (para aplicar filtro por subscriber_id)
+            
+        Returns:
+            CursorPaginatedArduinoDeviceResponse: Página de dispositivos e o cursor da próxima
+            
+        Raises:
+            HTTPException: Se o cursor for inválido
+        """
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        query = ArduinoDeviceService._filtered_query(db, filter_params, current_user)
+        
+        if cursor:
+            created_at, device_id = _decode_cursor(cursor)
+            query = query.filter(tuple_(ArduinoDevice.created_at, ArduinoDevice.id) < (created_at, device_id))
+        
+        # Buscar um item a mais para saber se existe uma próxima página
+        devices = (
+            query.options(raiseload("*"))
+            .order_by(ArduinoDevice.created_at.desc(), ArduinoDevice.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        next_cursor = None
+        if len(devices) > limit:
+            devices = devices[:limit]
+            next_cursor = _encode_cursor(devices[-1])
+        
+        return CursorPaginatedArduinoDeviceResponse(
+            size=limit,
+            items=devices,
+            next_cursor=next_cursor
+        )
+    
+    @staticmethod
+    def _filtered_query(
+        db: Session,
+        filter_params: Optional[ArduinoDeviceFilter] = None,
+        current_user: Optional["User"] = None
+    ):
+        """
+        Monta a consulta de dispositivos com os filtros de usuário e de busca
+        """
+        query = db.query(ArduinoDevice)
+        
+        # Aplicar filtros baseados no usuário logado
+        if current_user:
+            query = apply_subscriber_filter(query, current_user, ArduinoDevice)
+        
+        # Aplicar filtros adicionais: busca parcial nas colunas de texto, igualdade nas demais
+        if filter_params:
+            for field, value in filter_params.model_dump(exclude_none=True).items():
+                column = getattr(ArduinoDevice, field)
+                if field in _SEARCH_FIELDS:
+                    query = query.filter(column.ilike(f"%{value}%"))
+                else:
+                    query = query.filter(column == value)
+        
+        return query
+    
     @staticmethod
     def get_device_by_id(db: Session, device_id: uuid.UUID, current_user: Optional["User"] = None) -> Optional[ArduinoDevice]:
         """
@@ -141,21 +372,26 @@ class ArduinoDeviceService:
         return db.query(ArduinoDevice).filter(ArduinoDevice.mac_address == mac_address).first()
     
     @staticmethod
-    def validate_subscriber(db: Session, subscriber_id: uuid.UUID) -> Subscriber:
+    def validate_subscriber(db: Session, subscriber_id: uuid.UUID) -> uuid.UUID:
         """
-        Valida se o assinante existe
+        Valida se o assinante existe e está ativo
+        
+        O resultado fica em cache por até _SUBSCRIBER_CACHE_TTL segundos
         
         Args:
             db: Sessão do banco de dados
             subscriber_id: ID do assinante
             
         Returns:
-            Subscriber: Assinante encontrado
+            uuid.UUID: ID do assinante encontrado
             
         Raises:
             HTTPException: Se o assinante não for encontrado
         """
-        subscriber = db.query(Subscriber).filter(
+        if _get_cached_subscriber_id(subscriber_id) is not None:
+            return subscriber_id
+        
+        subscriber = db.query(Subscriber.id).filter(
             Subscriber.id == subscriber_id,
             Subscriber.is_active == True
         ).first()
@@ -166,24 +402,32 @@ class ArduinoDeviceService:
                 detail="Assinante não encontrado ou inativo"
             )
         
-        return subscriber
+        _cache_subscriber_id(subscriber_id, subscriber.id)
+        return subscriber.id
     
     @staticmethod
-    def validate_subscriber_by_code(db: Session, subscriber_code: str) -> Subscriber:
+    def validate_subscriber_by_code(db: Session, subscriber_code: str) -> uuid.UUID:
         """
         Valida se o assinante existe pelo documento (CPF/CNPJ)
         
+        O resultado fica em cache por até _SUBSCRIBER_CACHE_TTL segundos
+        
         Args:
             db: Sessão do banco de dados
             subscriber_code: Documento do assinante (CPF/CNPJ)
             
         Returns:
-            Subscriber: Assinante encontrado
+            uuid.UUID: ID do assinante encontrado
             
         Raises:
             HTTPException: Se o assinante não for encontrado
         """
-        subscriber = db.query(Subscriber).filter(
+        cache_key = ("document", subscriber_code)
+        subscriber_id = _get_cached_subscriber_id(cache_key)
+        if subscriber_id is not None:
+            return subscriber_id
+        
+        subscriber = db.query(Subscriber.id).filter(
             Subscriber.document == subscriber_code,
             Subscriber.is_active == True
         ).first()
@@ -194,7 +438,8 @@ class ArduinoDeviceService:
                 detail="Assinante não encontrado ou inativo. Verifique o código (CPF/CNPJ) informado."
             )
         
-        return subscriber
+        _cache_subscriber_id(cache_key, subscriber.id)
+        return subscriber.id
     
     @staticmethod
     def create_device(db: Session, device_data: ArduinoDeviceCreate) -> ArduinoDevice:
@@ -211,23 +456,8 @@ class ArduinoDeviceService:
         Raises:
             HTTPException: Se o device_id ou MAC já estiver em uso ou se o assinante não for encontrado
         """
-        # Verificar se o ID do dispositivo já está em uso
-        existing_id = ArduinoDeviceService.get_device_by_device_id(db, device_data.device_id)
-        if existing_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"ID de dispositivo '{device_data.device_id}' já está em uso"
-            )
-        
-        # Verificar se o MAC já está em uso
-        existing_mac = ArduinoDeviceService.get_device_by_mac(db, device_data.mac_address)
-        if existing_mac:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Endereço MAC '{device_data.mac_address}' já está em uso"
-            )
-        
-        # Verificar se o assinante existe
+        # Verificar se o assinante existe; device_id e MAC duplicados são
+        # detectados pelos índices únicos no INSERT
         ArduinoDeviceService.validate_subscriber(db, device_data.subscriber_id)
         
         # Criar o dispositivo
@@ -241,9 +471,7 @@ class ArduinoDeviceService:
             is_active=True
         )
         
-        db.add(new_device)
-        db.commit()
-        db.refresh(new_device)
+        _insert_device(db, new_device)
         
         return new_device
     
@@ -262,24 +490,9 @@ class ArduinoDeviceService:
         Raises:
             HTTPException: Se o device_id ou MAC já estiver em uso ou se o assinante não for encontrado
         """
-        # Verificar se o ID do dispositivo já está em uso
-        existing_id = ArduinoDeviceService.get_device_by_device_id(db, device_data["device_id"])
-        if existing_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"ID de dispositivo '{device_data['device_id']}' já está em uso"
-            )
-        
-        # Verificar se o MAC já está em uso
-        existing_mac = ArduinoDeviceService.get_device_by_mac(db, device_data["mac_address"])
-        if existing_mac:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Endereço MAC '{device_data['mac_address']}' já está em uso"
-            )
-        
-        # Buscar o assinante pelo código
-        subscriber = ArduinoDeviceService.validate_subscriber_by_code(db, device_data["subscriber_code"])
+        # Buscar o assinante pelo código; device_id e MAC duplicados são
+        # detectados pelos índices únicos no INSERT
+        subscriber_id = ArduinoDeviceService.validate_subscriber_by_code(db, device_data["subscriber_code"])
         
         # Criar o dispositivo
         new_device = ArduinoDevice(
@@ -288,16 +501,107 @@ class ArduinoDeviceService:
             description=device_data.get("description"),
             mac_address=device_data["mac_address"],
             firmware_version=device_data.get("firmware_version"),
-            subscriber_id=subscriber.id,
+            subscriber_id=subscriber_id,
             is_active=True
         )
         
-        db.add(new_device)
-        db.commit()
-        db.refresh(new_device)
+        _insert_device(db, new_device)
         
         return new_device
     
+    @staticmethod
+    def bulk_create_devices(db: Session, devices: List[ArduinoDeviceCreate]) -> Tuple[List[ArduinoDevice], List[str]]:
+        """
+        Cria vários dispositivos Arduino em um único INSERT ... RETURNING
+        
+        Dispositivos cujo device_id ou MAC já estejam em uso são ignorados
+        
+        Args:
+            db: Sessão do banco de dados
+            devices: Dados dos novos dispositivos
+            
+        Returns:
+            Tuple[List[ArduinoDevice], List[str]]: Dispositivos criados e device_ids ignorados
+            
+        Raises:
+            HTTPException: Se algum assinante não for encontrado ou estiver inativo
+        """
+        # Validar todos os assinantes do lote em uma só consulta
+        subscriber_ids = {device.subscriber_id for device in devices}
+        found = {
+            row.id for row in db.query(Subscriber.id).filter(
+                Subscriber.id.in_(subscriber_ids),
+                Subscriber.is_active == True
+            )
+        }
+        if found != subscriber_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Assinante não encontrado ou inativo"
+            )
+        
+        rows = [
+            {
+                "device_id": device.device_id,
+                "name": device.name,
+                "description": device.description,
+                "mac_address": device.mac_address,
+                "firmware_version": device.firmware_version,
+                "subscriber_id": device.subscriber_id,
+                "is_active": True
+            }
+            for device in devices
+        ]
+        return _insert_devices(db, rows)
+    
+    @staticmethod
+    def create_devices_public_bulk(
+        db: Session,
+        devices: List[PublicArduinoDeviceCreate]
+    ) -> Tuple[List[ArduinoDevice], List[str]]:
+        """
+        Cria vários dispositivos Arduino a partir da API pública em um único INSERT ... RETURNING
+        
+        Os códigos de assinante do lote são resolvidos em uma só consulta
+        
+        Args:
+            db: Sessão do banco de dados
+            devices: Dados dos novos dispositivos
+            
+        Returns:
+            Tuple[List[ArduinoDevice], List[str]]: Dispositivos criados e device_ids ignorados
+            
+        Raises:
+            HTTPException: Se algum assinante não for encontrado ou estiver inativo
+        """
+        codes = {device.subscriber_code for device in devices}
+        subscriber_ids = {
+            row.document: row.id for row in db.query(Subscriber.document, Subscriber.id).filter(
+                Subscriber.document.in_(codes),
+                Subscriber.is_active == True
+            )
+        }
+        missing = sorted(codes - subscriber_ids.keys())
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Assinante não encontrado ou inativo. Verifique os códigos (CPF/CNPJ) informados: {', '.join(missing)}"
+            )
+        
+        rows = [
+            {
+                "device_id": device.device_id,
+                "name": device.name,
+                "description": device.description,
+                "mac_address": device.mac_address,
+                "firmware_version": device.firmware_version,
+                "subscriber_id": subscriber_ids[device.subscriber_code],
+                "is_active": True
+            }
+            for device in devices
+        ]
+        return _insert_devices(db, rows)
+    
     @staticmethod
     def update_device(db: Session, device_id: uuid.UUID, device_data: ArduinoDeviceUpdate, current_user: Optional["User"] = None) -> Optional[ArduinoDevice]:
         """
@@ -315,45 +619,27 @@ class ArduinoDeviceService:
         Raises:
             HTTPException: Se o MAC já estiver em uso por outro dispositivo
         """
-        # Buscar o dispositivo pelo ID
-        device = ArduinoDeviceService.get_device_by_id(db, device_id, current_user=current_user)
-        if not device:
-            return None
-        
-        # Verificar se o MAC já está em uso por outro dispositivo
-        if device_data.mac_address and device_data.mac_address != device.mac_address:
-            existing_mac = ArduinoDeviceService.get_device_by_mac(db, device_data.mac_address)
-            if existing_mac and existing_mac.id != device_id:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Endereço MAC '{device_data.mac_address}' já está em uso por outro dispositivo"
-                )
-        
-        # Atualizar os campos
-        if device_data.name is not None:
-            device.name = device_data.name
-        
-        if device_data.description is not None:
-            device.description = device_data.description
-        
-        if device_data.mac_address is not None:
-            device.mac_address = device_data.mac_address
-        
-        if device_data.ip_address is not None:
-            device.ip_address = device_data.ip_address
-        
-        if device_data.firmware_version is not None:
-            device.firmware_version = device_data.firmware_version
-        
-        if device_data.is_active is not None:
-            device.is_active = device_data.is_active
-        
-        device.updated_at = datetime.utcnow()
-        
-        db.commit()
-        db.refresh(device)
-        
-        return device
+        # Apenas os campos informados são atualizados, em um único UPDATE ... RETURNING;
+        # MAC duplicado é detectado pelo índice único
+        values = device_data.model_dump(exclude_none=True)
+        if "ip_address" in values:
+            values["ip_address"] = str(values["ip_address"])
+        values["updated_at"] = _DB_UTC_NOW
+        
+        stmt = update(ArduinoDevice).where(ArduinoDevice.id == device_id).values(**values)
+        if current_user:
+            stmt = apply_subscriber_filter(stmt, current_user, ArduinoDevice)
+        
+        try:
+            return _execute_update(db, stmt)
+        except IntegrityError as e:
+            db.rollback()
+            if "mac_address" not in _constraint_name(e):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Endereço MAC '{device_data.mac_address}' já está em uso por outro dispositivo"
+            )
     
     @staticmethod
     def update_device_connection(db: Session, device_id_or_mac: str, ip_address: str) -> Optional[ArduinoDevice]:
@@ -368,26 +654,27 @@ class ArduinoDeviceService:
         Returns:
             Optional[ArduinoDevice]: Dispositivo atualizado ou None se não for encontrado
         """
-        # Buscar o dispositivo pelo ID ou MAC
-        device = db.query(ArduinoDevice).filter(
-            or_(
-                ArduinoDevice.device_id == device_id_or_mac,
-                ArduinoDevice.mac_address == device_id_or_mac
-            ),
-            ArduinoDevice.is_active == True
-        ).first()
-        
-        if not device:
-            return None
-        
-        # Atualizar informações de conexão
-        device.ip_address = ip_address
-        device.last_connection = datetime.utcnow()
-        
-        db.commit()
-        db.refresh(device)
+        # Um único dispositivo ativo é atualizado, mesmo que a chave seja o device_id de um
+        # e o MAC de outro; a correspondência por device_id tem preferência
+        target_id = (
+            select(ArduinoDevice.id)
+            .where(
+                or_(
+                    ArduinoDevice.device_id == device_id_or_mac,
+                    ArduinoDevice.mac_address == device_id_or_mac
+                ),
+                ArduinoDevice.is_active == True
+            )
+            .order_by((ArduinoDevice.device_id == device_id_or_mac).desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = update(ArduinoDevice).where(ArduinoDevice.id == target_id).values(
+            ip_address=ip_address,
+            last_connection=_DB_UTC_NOW
+        )
         
-        return device
+        return _execute_update(db, stmt)
     
     @staticmethod
     def delete_device(db: Session, device_id: uuid.UUID, current_user: Optional["User"] = None) -> bool:
@@ -427,16 +714,12 @@ class ArduinoDeviceService:
         Returns:
             Optional[ArduinoDevice]: Dispositivo atualizado ou None se não for encontrado
         """
-        # Buscar o dispositivo pelo ID
-        device = ArduinoDeviceService.get_device_by_id(db, device_id, current_user=current_user)
-        if not device:
-            return None
-        
         # Atualizar o status
-        device.is_active = activate
-        device.updated_at = datetime.utcnow()
-        
-        db.commit()
-        db.refresh(device)
+        stmt = update(ArduinoDevice).where(ArduinoDevice.id == device_id).values(
+            is_active=activate,
+            updated_at=_DB_UTC_NOW
+        )
+        if current_user:
+            stmt = apply_subscriber_filter(stmt, current_user, ArduinoDevice)
         
-        return device
\ No newline at end of file
+        return _execute_update(db, stmt)
@@ -22,6 +22,10 @@ from app.core.security import (
 )
 from app.core.role_hierarchy import get_permissions_for_role
 
+# Hash bcrypt (mesmo custo do get_password_hash) usado quando o email não existe, para que
+# o tempo de resposta do login não revele se a conta está cadastrada
+_DUMMY_PASSWORD_HASH = "$2b$12$AY9KJNBT2AJARPdBgAoU5eNgExj0cfwmBZuC7nHSXnhhhTZCl3M7W"
+
 
 class AuthService:
     """
@@ -41,15 +45,14 @@ class AuthService:
         Returns:
             Optional[User]: Usuário autenticado ou None
         """
-        user = UserService.get_user_by_email(db, email)
+        # O assinante é carregado junto, pois create_login_tokens lê o segment_id
+        user = UserService.get_user_by_email(db, email, with_subscriber=True)
         
-        if not user:
-            return None
-            
-        if not UserService.verify_password(password, user.password_hash):
-            return None
-            
-        if not user.is_active:
+        # A senha é sempre verificada, exista ou não o usuário, para manter o tempo constante
+        password_hash = user.password_hash if user else _DUMMY_PASSWORD_HASH
+        password_ok = UserService.verify_password(password, password_hash)
+        
+        if not user or not password_ok or not user.is_active:
             return None
             
         return user
@@ -131,7 +134,7 @@ class AuthService:
             user_id = int(payload.get("sub"))
             
             # Buscar usuário no banco
-            user = UserService.get_user_by_id(db, user_id)
+            user = UserService.get_user_by_id(db, user_id, with_subscriber=True)
             if not user or not user.is_active:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
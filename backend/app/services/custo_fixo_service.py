@@ -62,14 +62,10 @@ class CustoFixoService:
         # Ordenar e aplicar paginação
         custos = query.order_by(desc(CostFixed.data)).offset(skip).limit(limit).all()
         
-        # Converter para schema de resposta
-        items = [CustoFixoResponse.model_validate(custo) for custo in custos]
-        
-        return CustoFixoList(
-            items=items,
-            total=total,
-            skip=skip,
-            limit=limit
+        # Converter para schema de resposta (a lista é validada em uma única chamada)
+        return CustoFixoList.model_validate(
+            {"items": custos, "total": total, "skip": skip, "limit": limit},
+            from_attributes=True
         )
     
     @staticmethod
@@ -67,29 +67,11 @@ class CustoVariavelService:
         # Ordenar e aplicar paginação
         custos = query.order_by(desc(CostVariable.data)).offset(skip).limit(limit).all()
         
-        # Converter para schema de resposta e calcular o valor total
-        items = []
-        for custo in custos:
-            custo_dict = {
-                "id": custo.id,
-                "subscriber_id": custo.subscriber_id,
-                "nome": custo.nome,
-                "valor_unitario": custo.valor_unitario,
-                "quantidade": custo.quantidade,
-                "data": custo.data,
-                "observacoes": custo.observacoes,
-                "is_active": custo.is_active,
-                "created_at": custo.created_at,
-                "updated_at": custo.updated_at,
-                "valor_total": custo.valor_unitario * custo.quantidade
-            }
-            items.append(CustoVariavelResponse.model_validate(custo_dict))
-        
-        return CustoVariavelList(
-            items=items,
-            total=total,
-            skip=skip,
-            limit=limit
+        # Converter para schema de resposta (valor_total é calculado pelo schema
+        # e a lista é validada em uma única chamada)
+        return CustoVariavelList.model_validate(
+            {"items": custos, "total": total, "skip": skip, "limit": limit},
+            from_attributes=True
         )
     
     @staticmethod
@@ -124,22 +106,8 @@ class CustoVariavelService:
         if not custo:
             return None
         
-        # Converter para schema de resposta e calcular o valor total
-        custo_dict = {
-            "id": custo.id,
-            "subscriber_id": custo.subscriber_id,
-            "nome": custo.nome,
-            "valor_unitario": custo.valor_unitario,
-            "quantidade": custo.quantidade,
-            "data": custo.data,
-            "observacoes": custo.observacoes,
-            "is_active": custo.is_active,
-            "created_at": custo.created_at,
-            "updated_at": custo.updated_at,
-            "valor_total": custo.valor_unitario * custo.quantidade
-        }
-        
-        return CustoVariavelResponse.model_validate(custo_dict)
+        # Converter para schema de resposta (valor_total é calculado pelo schema)
+        return CustoVariavelResponse.model_validate(custo)
     
     @staticmethod
     def create_custo_variavel(
@@ -178,22 +146,8 @@ class CustoVariavelService:
         db.commit()
         db.refresh(db_custo)
         
-        # Converter para schema de resposta e calcular o valor total
-        custo_dict = {
-            "id": db_custo.id,
-            "subscriber_id": db_custo.subscriber_id,
-            "nome": db_custo.nome,
-            "valor_unitario": db_custo.valor_unitario,
-            "quantidade": db_custo.quantidade,
-            "data": db_custo.data,
-            "observacoes": db_custo.observacoes,
-            "is_active": db_custo.is_active,
-            "created_at": db_custo.created_at,
-            "updated_at": db_custo.updated_at,
-            "valor_total": db_custo.valor_unitario * db_custo.quantidade
-        }
-        
-        return CustoVariavelResponse.model_validate(custo_dict)
+        # Converter para schema de resposta (valor_total é calculado pelo schema)
+        return CustoVariavelResponse.model_validate(db_custo)
     
     @staticmethod
     def update_custo_variavel(
@@ -240,22 +194,8 @@ class CustoVariavelService:
         db.commit()
         db.refresh(db_custo)
         
-        # Converter para schema de resposta e calcular o valor total
-        custo_dict = {
-            "id": db_custo.id,
-            "subscriber_id": db_custo.subscriber_id,
-            "nome": db_custo.nome,
-            "valor_unitario": db_custo.valor_unitario,
-            "quantidade": db_custo.quantidade,
-            "data": db_custo.data,
-            "observacoes": db_custo.observacoes,
-            "is_active": db_custo.is_active,
-            "created_at": db_custo.created_at,
-            "updated_at": db_custo.updated_at,
-            "valor_total": db_custo.valor_unitario * db_custo.quantidade
-        }
-        
-        return CustoVariavelResponse.model_validate(custo_dict)
+        # Converter para schema de resposta (valor_total é calculado pelo schema)
+        return CustoVariavelResponse.model_validate(db_custo)
     
     @staticmethod
     def delete_custo_variavel(
@@ -27,7 +27,7 @@ class PatientService:
         Returns:
             Patient: Objeto do paciente criado
         """
-        patient_dict = patient_data.dict()
+        patient_dict = patient_data.model_dump()
         patient = Patient(**patient_dict, subscriber_id=subscriber_id)
         
         db.add(patient)
@@ -136,7 +136,7 @@ class PatientService:
         patient = PatientService.get_patient(db, patient_id, subscriber_id)
         
         # Atualizar apenas campos não-nulos
-        update_data = patient_data.dict(exclude_unset=True)
+        update_data = patient_data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             if value is not None:  # Não atualiza campos explicitamente definidos como None
                 setattr(patient, key, value)
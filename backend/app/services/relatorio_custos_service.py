@@ -284,7 +284,7 @@ class RelatorioCustosService:
         recalcular = False
         
         # Atualizar campos
-        data_dict = data.dict(exclude_unset=True)
+        data_dict = data.model_dump(exclude_unset=True)
         for field, value in data_dict.items():
             if field in ['date_from', 'date_to'] and value:
                 recalcular = True
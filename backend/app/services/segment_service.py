@@ -87,15 +87,15 @@ class SegmentService:
             segment_ids = [str(segment.id) for segment in segments]
             print(f"[DEBUG] IDs dos segmentos: {segment_ids}")
             
-            # Converter os objetos Segment para dicionários e depois para SegmentResponse
-            segment_responses = [SegmentResponse.model_validate(segment) for segment in segments]
-            
-            # Criar resposta paginada
-            return PaginatedSegmentResponse(
-                total=total,
-                page=skip // limit + 1 if limit > 0 else 1,
-                size=limit,
-                items=segment_responses
+            # Criar resposta paginada, validando a lista de Segment em uma única chamada
+            return PaginatedSegmentResponse.model_validate(
+                {
+                    "total": total,
+                    "page": skip // limit + 1 if limit > 0 else 1,
+                    "size": limit,
+                    "items": segments
+                },
+                from_attributes=True
             )
         except Exception as e:
             print(f"[ERROR] Erro no SegmentService.get_segments: {str(e)}")
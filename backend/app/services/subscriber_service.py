@@ -11,6 +11,7 @@ from fastapi import HTTPException, status
 from app.db.models import Subscriber, User, Segment, Plan, UserRole
 from app.schemas.subscriber import SubscriberCreate, SubscriberUpdate
 from app.services.user_service import UserService
+from app.services.arduino_device_service import clear_subscriber_cache
 
 
 class SubscriberService:
@@ -239,6 +240,7 @@ class SubscriberService:
         admin_user = UserService.create_user(db, admin_user_data, subscriber_id=db_subscriber.id)
         
         db.commit()
+        clear_subscriber_cache()
         db.refresh(db_subscriber)
         
         return db_subscriber
@@ -314,6 +316,7 @@ class SubscriberService:
             setattr(db_subscriber, key, value)
         
         db.commit()
+        clear_subscriber_cache()
         db.refresh(db_subscriber)
         
         return db_subscriber
@@ -342,6 +345,7 @@ class SubscriberService:
             user.is_active = False
         
         db.commit()
+        clear_subscriber_cache()
         
         return True
     
@@ -369,6 +373,7 @@ class SubscriberService:
             user.is_active = activate
         
         db.commit()
+        clear_subscriber_cache()
         db.refresh(subscriber)
         
         return subscriber
\ No newline at end of file
@@ -5,7 +5,7 @@ Serviço para operações CRUD de usuários
 from typing import Optional, List, Dict, Any, Union
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException, status
 import bcrypt
 
@@ -102,19 +102,24 @@ class UserService:
         # Aplicar paginação
         users = query.offset(skip).limit(limit).all()
         
-        # Converter os objetos User para dicionários e depois para UserResponse
-        user_responses = [UserResponse.model_validate(user) for user in users]
-        
-        # Criar resposta paginada
-        return PaginatedUserResponse(
-            total=total,
-            page=skip // limit + 1 if limit > 0 else 1,
-            size=limit,
-            items=user_responses
+        # Criar resposta paginada, validando a lista de User em uma única chamada
+        return PaginatedUserResponse.model_validate(
+            {
+                "total": total,
+                "page": skip // limit + 1 if limit > 0 else 1,
+                "size": limit,
+                "items": users
+            },
+            from_attributes=True
         )
     
     @staticmethod
-    def get_user_by_id(db: Session, user_id: int, current_user: Optional[User] = None) -> Optional[User]:
+    def get_user_by_id(
+        db: Session,
+        user_id: int,
+        current_user: Optional[User] = None,
+        with_subscriber: bool = False
+    ) -> Optional[User]:
         """
         Busca um usuário pelo ID
         
@@ -122,11 +127,14 @@ class UserService:
             db: Sessão do banco de dados
             user_id: ID do usuário
             current_user: Usuário atual para filtragem por subscriber_id
+            with_subscriber: Se True, carrega o assinante na mesma consulta (JOIN)
             
         Returns:
             Optional[User]: Usuário encontrado ou None
         """
         query = db.query(User).filter(User.id == user_id)
+        if with_subscriber:
+            query = query.options(joinedload(User.subscriber))
         
         # Aplicar filtro de subscriber_id para usuários que não são administradores
         if current_user and current_user.role not in [UserRole.SUPER_ADMIN, UserRole.DIRETOR]:
@@ -140,18 +148,22 @@ class UserService:
         return query.first()
     
     @staticmethod
-    def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    def get_user_by_email(db: Session, email: str, with_subscriber: bool = False) -> Optional[User]:
         """
         Busca um usuário pelo email
         
         Args:
             db: Sessão do banco de dados
             email: Email do usuário
+            with_subscriber: Se True, carrega o assinante na mesma consulta (JOIN)
             
         Returns:
             Optional[User]: Usuário encontrado ou None
         """
-        return db.query(User).filter(User.email == email).first()
+        query = db.query(User).filter(User.email == email)
+        if with_subscriber:
+            query = query.options(joinedload(User.subscriber))
+        return query.first()
     
     @staticmethod
     def create_user(db: Session, user_data: UserCreate, subscriber_id: UUID = None) -> User:
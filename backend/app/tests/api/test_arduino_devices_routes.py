@@ -0,0 +1,53 @@
+"""
+Testes para as rotas de dispositivos Arduino
+"""
+import unittest
+from uuid import uuid4
+
+from fastapi import HTTPException
+
+from app.api.routes_arduino_devices import _scope_to_user_subscriber
+from app.db.models import User, UserRole
+from app.schemas.arduino_device import ArduinoDeviceCreate
+
+
+class TestScopeToUserSubscriber(unittest.TestCase):
+    """
+    Testes do vínculo do dispositivo criado ao assinante do usuário.
+    """
+
+    def setUp(self):
+        self.device_data = ArduinoDeviceCreate(
+            device_id="ARD-001",
+            name="Sensor Sala 1",
+            mac_address="AA:BB:CC:DD:EE:FF",
+            subscriber_id=uuid4()
+        )
+
+    def test_admin_keeps_requested_subscriber(self):
+        """
+        Testa que SUPER_ADMIN e DIRETOR podem criar dispositivos para qualquer assinante.
+        """
+        for role in (UserRole.SUPER_ADMIN, UserRole.DIRETOR):
+            scoped = _scope_to_user_subscriber(self.device_data, User(role=role))
+            self.assertEqual(scoped.subscriber_id, self.device_data.subscriber_id)
+
+    def test_subscriber_user_is_forced_to_own_subscriber(self):
+        """
+        Testa que os demais usuários só criam dispositivos para o próprio assinante.
+        """
+        own_subscriber = uuid4()
+        user = User(role=UserRole.DONO_ASSINANTE, subscriber_id=own_subscriber)
+        self.assertEqual(_scope_to_user_subscriber(self.device_data, user).subscriber_id, own_subscriber)
+
+    def test_user_without_subscriber_is_forbidden(self):
+        """
+        Testa que usuários sem assinante não podem criar dispositivos.
+        """
+        with self.assertRaises(HTTPException) as ctx:
+            _scope_to_user_subscriber(self.device_data, User(role=UserRole.COLABORADOR_NIVEL_2))
+        self.assertEqual(ctx.exception.status_code, 403)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,7 +50,7 @@ class FakePatientRepository(PatientRepository):
                 )
         
         # Criar nova entidade de paciente
-        patient_dict = patient_data.dict()
+        patient_dict = patient_data.model_dump()
         patient = PatientEntity(
             id=None,  # ID será gerado automaticamente
             name=patient_dict["name"],
@@ -134,7 +134,7 @@ class FakePatientRepository(PatientRepository):
                     )
         
         # Atualizar campos
-        update_data = patient_data.dict(exclude_unset=True)
+        update_data = patient_data.model_dump(exclude_unset=True)
         
         # Atualizar informações pessoais
         if "name" in update_data or "cpf" in update_data or "rg" in update_data or "birth_date" in update_data:
@@ -0,0 +1,53 @@
+"""
+Testes para os esquemas de agendamentos
+"""
+import unittest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from app.schemas.appointment_schema import AppointmentCreate, AppointmentResponse
+
+
+class TestAppointmentTimeValidation(unittest.TestCase):
+    """
+    Testes unitários para a validação do intervalo de horários.
+    """
+
+    def _fields(self, start_time, end_time):
+        return {
+            "patient_id": uuid4(),
+            "provider_id": uuid4(),
+            "service_name": "Consulta",
+            "start_time": start_time,
+            "end_time": end_time
+        }
+
+    def test_create_rejects_end_before_start(self):
+        """
+        Testa que a criação rejeita término anterior ao início.
+        """
+        start = datetime(2025, 6, 1, 10, 0)
+        with self.assertRaises(ValidationError):
+            AppointmentCreate(**self._fields(start, start - timedelta(hours=1)))
+
+    def test_response_does_not_revalidate_stored_times(self):
+        """
+        Testa que a resposta repassa os horários do banco sem revalidá-los.
+        """
+        start = datetime(2025, 6, 1, 10, 0)
+        now = datetime(2025, 6, 1, 9, 0)
+        response = AppointmentResponse(
+            **self._fields(start, start),
+            id=uuid4(),
+            subscriber_id=uuid4(),
+            is_active=True,
+            created_at=now,
+            updated_at=now
+        )
+        self.assertEqual(response.end_time, start)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Testes para os esquemas de dispositivos Arduino
+"""
+import unittest
+from datetime import datetime
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from app.schemas.arduino_device import (
+    ArduinoDeviceBulkCreate,
+    ArduinoDeviceCreate,
+    ArduinoDeviceResponse,
+    ArduinoDeviceUpdate,
+    PublicArduinoDeviceBulkCreate
+)
+
+
+class TestArduinoDeviceMacValidation(unittest.TestCase):
+    """
+    Testes unitários para a validação do endereço MAC.
+    """
+
+    def _create(self, mac_address):
+        return ArduinoDeviceCreate(
+            device_id="ARD-001",
+            name="Sensor Sala 1",
+            mac_address=mac_address,
+            subscriber_id=uuid4()
+        )
+
+    def test_valid_mac_addresses(self):
+        """
+        Testa que MACs com separadores ':' ou '-' são aceitos.
+        """
+        for mac in ("AA:BB:CC:DD:EE:FF", "aa-bb-cc-dd-ee-ff", "01:23:45:67:89:aB"):
+            self._create(mac)
+
+    def test_mac_is_normalized(self):
+        """
+        Testa que o MAC é armazenado em maiúsculas com separador ':'.
+        """
+        self.assertEqual(self._create("aa-bb-cc-dd-ee-ff").mac_address, "AA:BB:CC:DD:EE:FF")
+        self.assertEqual(
+            ArduinoDeviceUpdate(mac_address="01-23-45-67-89-ab").mac_address,
+            "01:23:45:67:89:AB"
+        )
+
+    def test_response_does_not_revalidate_mac(self):
+        """
+        Testa que a resposta repassa o MAC vindo do banco sem validá-lo.
+        """
+        response = ArduinoDeviceResponse(
+            id=uuid4(),
+            device_id="ARD-001",
+            name="Sensor Sala 1",
+            mac_address="aa-bb-cc-dd-ee-ff",
+            is_active=True,
+            subscriber_id=uuid4(),
+            created_at=datetime.utcnow()
+        )
+        self.assertEqual(response.mac_address, "aa-bb-cc-dd-ee-ff")
+
+    def test_invalid_mac_addresses(self):
+        """
+        Testa que MACs fora do formato geram erro de validação.
+        """
+        invalid = (
+            "",
+            "AA:BB:CC:DD:EE",
+            "AA:BB:CC:DD:EE:FF:00",
+            "AABBCCDDEEFF",
+            "AA:BB:CC:DD:EE:FG",
+            "AA.BB.CC.DD.EE.FF",
+            "AA:BB:CC:DD:EE:FF\n",
+            "ÀA:BB:CC:DD:EE:FF",
+        )
+        for mac in invalid:
+            with self.assertRaises(ValidationError):
+                self._create(mac)
+
+    def test_update_allows_missing_mac(self):
+        """
+        Testa que a atualização aceita MAC ausente.
+        """
+        self.assertIsNone(ArduinoDeviceUpdate(name="Sensor").mac_address)
+
+    def test_update_validates_ip_address(self):
+        """
+        Testa que a atualização aceita IPv4/IPv6 e rejeita endereços inválidos.
+        """
+        for ip in ("192.168.0.10", "fe80::1"):
+            self.assertEqual(str(ArduinoDeviceUpdate(ip_address=ip).ip_address), ip)
+        with self.assertRaises(ValidationError):
+            ArduinoDeviceUpdate(ip_address="192.168.0.300")
+
+
+class TestArduinoDeviceBulkCreate(unittest.TestCase):
+    """
+    Testes unitários para o esquema de criação em lote.
+    """
+
+    def test_bulk_create_validates_each_device(self):
+        """
+        Testa que cada dispositivo do lote tem o MAC validado e normalizado.
+        """
+        bulk = ArduinoDeviceBulkCreate(devices=[
+            {"device_id": "ARD-001", "name": "Sensor 1", "mac_address": "aa-bb-cc-dd-ee-ff", "subscriber_id": uuid4()}
+        ])
+        self.assertEqual(bulk.devices[0].mac_address, "AA:BB:CC:DD:EE:FF")
+        with self.assertRaises(ValidationError):
+            ArduinoDeviceBulkCreate(devices=[
+                {"device_id": "ARD-002", "name": "Sensor 2", "mac_address": "invalido", "subscriber_id": uuid4()}
+            ])
+
+    def test_bulk_create_rejects_empty_list(self):
+        """
+        Testa que o lote precisa ter ao menos um dispositivo.
+        """
+        with self.assertRaises(ValidationError):
+            ArduinoDeviceBulkCreate(devices=[])
+
+    def test_bulk_create_rejects_repeated_device_id_or_mac(self):
+        """
+        Testa que o lote não pode repetir device_id nem MAC (mesmo com separador diferente).
+        """
+        subscriber_id = uuid4()
+        repeated_id = [
+            {"device_id": "ARD-001", "name": "Sensor 1", "mac_address": "AA:BB:CC:DD:EE:01", "subscriber_id": subscriber_id},
+            {"device_id": "ARD-001", "name": "Sensor 2", "mac_address": "AA:BB:CC:DD:EE:02", "subscriber_id": subscriber_id},
+        ]
+        repeated_mac = [
+            {"device_id": "ARD-001", "name": "Sensor 1", "mac_address": "AA:BB:CC:DD:EE:01", "subscriber_code": "12345678000195"},
+            {"device_id": "ARD-002", "name": "Sensor 2", "mac_address": "aa-bb-cc-dd-ee-01", "subscriber_code": "12345678000195"},
+        ]
+        with self.assertRaises(ValidationError):
+            ArduinoDeviceBulkCreate(devices=repeated_id)
+        with self.assertRaises(ValidationError):
+            PublicArduinoDeviceBulkCreate(devices=repeated_mac)
+
+    def test_public_bulk_create_validates_each_device(self):
+        """
+        Testa que o lote público valida o MAC e exige o código do assinante.
+        """
+        bulk = PublicArduinoDeviceBulkCreate(devices=[
+            {"device_id": "ARD-001", "name": "Sensor 1", "mac_address": "aa:bb:cc:dd:ee:ff", "subscriber_code": "12345678000195"}
+        ])
+        self.assertEqual(bulk.devices[0].mac_address, "AA:BB:CC:DD:EE:FF")
+        with self.assertRaises(ValidationError):
+            PublicArduinoDeviceBulkCreate(devices=[
+                {"device_id": "ARD-002", "name": "Sensor 2", "mac_address": "AA:BB:CC:DD:EE:FF"}
+            ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""
+Testes para os esquemas de autenticação
+"""
+import unittest
+
+from pydantic import ValidationError
+
+from app.schemas.auth import LoginRequest
+
+
+class TestLoginRequest(unittest.TestCase):
+    """
+    Testes unitários para a validação do email no login.
+    """
+
+    def test_normalizes_domain(self):
+        """
+        Testa que o domínio é convertido para minúsculas e a parte local preservada.
+        """
+        login = LoginRequest(email="Joao@Exemplo.COM", password="senha1234")
+        self.assertEqual(login.email, "Joao@exemplo.com")
+
+    def test_rejects_invalid_email(self):
+        """
+        Testa que emails malformados são rejeitados.
+        """
+        for email in ("joao", "joao@exemplo", "jo ao@exemplo.com", "joao@exemplo.com\n"):
+            with self.assertRaises(ValidationError, msg=email):
+                LoginRequest(email=email, password="senha1234")
+
+
+if __name__ == "__main__":
+    unittest.main()
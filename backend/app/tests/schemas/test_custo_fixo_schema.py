@@ -0,0 +1,44 @@
+"""
+Testes para os esquemas de custos fixos
+"""
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from pydantic import ValidationError
+
+from app.schemas.custo_fixo import CustoFixoCreate, CustoFixoUpdate
+
+
+class TestCustoFixoValor(unittest.TestCase):
+    """
+    Testes unitários para a validação das casas decimais do valor.
+    """
+
+    def _create(self, valor):
+        return CustoFixoCreate(nome="Aluguel", valor=valor, data=date(2024, 1, 1))
+
+    def test_accepts_up_to_two_places(self):
+        """
+        Testa que valores com até 2 casas decimais são aceitos.
+        """
+        for value in ("10", "10.5", "10.55", "1E+3", "10.500"):
+            self.assertEqual(self._create(value).valor, Decimal(value))
+
+    def test_rejects_more_than_two_places(self):
+        """
+        Testa que valores com mais de 2 casas decimais são rejeitados.
+        """
+        for value in ("10.555", "0.001"):
+            with self.assertRaises(ValidationError, msg=value):
+                self._create(value)
+
+    def test_update_allows_missing_valor(self):
+        """
+        Testa que a atualização aceita valor ausente.
+        """
+        self.assertIsNone(CustoFixoUpdate(nome="Aluguel").valor)
+
+
+if __name__ == "__main__":
+    unittest.main()
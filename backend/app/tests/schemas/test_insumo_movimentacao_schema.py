@@ -0,0 +1,34 @@
+"""
+Testes para os esquemas de movimentações de insumos
+"""
+import unittest
+from datetime import datetime
+
+from pydantic import ValidationError
+
+from app.schemas.insumo_movimentacao import InsumoEstoqueHistoricoRequest
+
+
+class TestInsumoEstoqueHistoricoRequest(unittest.TestCase):
+    """
+    Testes unitários para o filtro de período do histórico.
+    """
+
+    def test_accepts_ordered_or_partial_period(self):
+        """
+        Testa que períodos ordenados ou com apenas uma das datas são aceitos.
+        """
+        InsumoEstoqueHistoricoRequest(data_inicio=datetime(2024, 1, 1), data_fim=datetime(2024, 1, 31))
+        InsumoEstoqueHistoricoRequest(data_fim=datetime(2024, 1, 31))
+        InsumoEstoqueHistoricoRequest(data_inicio=datetime(2024, 1, 1))
+
+    def test_rejects_end_before_start(self):
+        """
+        Testa que a data final anterior à inicial gera erro de validação.
+        """
+        with self.assertRaises(ValidationError):
+            InsumoEstoqueHistoricoRequest(data_inicio=datetime(2024, 1, 31), data_fim=datetime(2024, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Testes para os esquemas de assinantes
+"""
+import unittest
+
+from pydantic import ValidationError
+
+from app.schemas.subscriber import SubscriberCreate, SubscriberUpdate
+
+
+class TestSubscriberCnpjValidation(unittest.TestCase):
+    """
+    Testes unitários para a validação do CNPJ.
+    """
+
+    def test_accepts_formatted_and_plain_cnpj(self):
+        """
+        Testa que o CNPJ é aceito com ou sem pontuação e mantido como enviado.
+        """
+        for cnpj in ("12.345.678/0001-95", "12345678000195"):
+            self.assertEqual(SubscriberCreate(name="Clínica", cnpj=cnpj).cnpj, cnpj)
+            self.assertEqual(SubscriberUpdate(cnpj=cnpj).cnpj, cnpj)
+
+    def test_rejects_wrong_digit_count(self):
+        """
+        Testa que CNPJs sem exatamente 14 dígitos são rejeitados.
+        """
+        for cnpj in ("12.345.678/0001-9", "123.456.789-01", "１２345678000195"):
+            with self.assertRaises(ValidationError, msg=cnpj):
+                SubscriberCreate(name="Clínica", cnpj=cnpj)
+            with self.assertRaises(ValidationError, msg=cnpj):
+                SubscriberUpdate(cnpj=cnpj)
+
+
+class TestSubscriberContactEmail(unittest.TestCase):
+    """
+    Testes unitários para a validação do email de contato.
+    """
+
+    def test_normalizes_and_rejects_like_email_str(self):
+        """
+        Testa que o email é normalizado como no EmailStr e que emails inválidos são rejeitados,
+        inclusive quando repetidos.
+        """
+        for _ in range(2):
+            self.assertEqual(SubscriberUpdate(contact_email="Joao@Exemplo.COM").contact_email, "Joao@exemplo.com")
+            with self.assertRaises(ValidationError):
+                SubscriberUpdate(contact_email="joao@")
+
+
+if __name__ == "__main__":
+    unittest.main()
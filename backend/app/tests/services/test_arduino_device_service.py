@@ -0,0 +1,141 @@
+"""
+Testes para o serviço de dispositivos Arduino
+"""
+import threading
+import unittest
+from unittest import mock
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.db.models import ArduinoDevice
+from app.services import arduino_device_service
+from app.services.arduino_device_service import ArduinoDeviceService
+
+
+class TestUpdateDeviceConnection(unittest.TestCase):
+    """
+    Testes do registro de conexão, executados em um SQLite em memória.
+    """
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        # O serviço usa timezone('utc', now()) do PostgreSQL
+        event.listen(
+            self.engine,
+            "connect",
+            lambda conn, _: conn.create_function("timezone", 2, lambda _tz, ts: ts)
+        )
+        ArduinoDevice.__table__.create(self.engine)
+        self.db = Session(self.engine)
+        self.subscriber_id = uuid4()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _add_device(self, device_id, mac_address):
+        self.db.add(ArduinoDevice(
+            device_id=device_id,
+            name=f"Sensor {device_id}",
+            mac_address=mac_address,
+            subscriber_id=self.subscriber_id,
+            is_active=True
+        ))
+        self.db.commit()
+
+    def test_updates_device_by_mac(self):
+        """
+        Testa que a conexão é registrada pelo MAC do dispositivo.
+        """
+        self._add_device("ARD-001", "AA:BB:CC:DD:EE:01")
+        device = ArduinoDeviceService.update_device_connection(self.db, "AA:BB:CC:DD:EE:01", "10.0.0.5")
+        self.assertEqual(device.device_id, "ARD-001")
+        self.assertEqual(device.ip_address, "10.0.0.5")
+        self.assertIsNotNone(device.last_connection)
+
+    def test_key_matching_two_devices_updates_one(self):
+        """
+        Testa que uma chave igual ao device_id de um dispositivo e ao MAC de
+        outro atualiza apenas o dispositivo com o device_id correspondente.
+        """
+        self._add_device("AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02")
+        self._add_device("ARD-002", "AA:BB:CC:DD:EE:01")
+
+        device = ArduinoDeviceService.update_device_connection(self.db, "AA:BB:CC:DD:EE:01", "10.0.0.5")
+
+        self.assertEqual(device.device_id, "AA:BB:CC:DD:EE:01")
+        other = self.db.query(ArduinoDevice).filter(ArduinoDevice.device_id == "ARD-002").one()
+        self.assertIsNone(other.ip_address)
+
+    def test_unknown_device_returns_none(self):
+        """
+        Testa que uma chave sem dispositivo ativo retorna None.
+        """
+        self.assertIsNone(ArduinoDeviceService.update_device_connection(self.db, "ARD-404", "10.0.0.5"))
+
+
+class TestSubscriberCache(unittest.TestCase):
+    """
+    Testes do cache de assinantes usado no cadastro de dispositivos.
+    """
+
+    def setUp(self):
+        arduino_device_service.clear_subscriber_cache()
+
+    def tearDown(self):
+        arduino_device_service.clear_subscriber_cache()
+
+    def test_full_cache_evicts_oldest_entry(self):
+        """
+        Testa que, com o cache cheio, a entrada mais antiga é descartada.
+        """
+        with mock.patch.object(arduino_device_service, "_SUBSCRIBER_CACHE_MAX_SIZE", 2):
+            first, second, third = uuid4(), uuid4(), uuid4()
+            arduino_device_service._cache_subscriber_id(first, first)
+            arduino_device_service._cache_subscriber_id(second, second)
+            arduino_device_service._cache_subscriber_id(third, third)
+
+        self.assertIsNone(arduino_device_service._get_cached_subscriber_id(first))
+        self.assertEqual(arduino_device_service._get_cached_subscriber_id(third), third)
+
+    def test_forget_subscriber_removes_every_key(self):
+        """
+        Testa que as entradas por ID e por documento do assinante são removidas.
+        """
+        subscriber_id = uuid4()
+        arduino_device_service._cache_subscriber_id(subscriber_id, subscriber_id)
+        arduino_device_service._cache_subscriber_id(("document", "12345678000195"), subscriber_id)
+
+        arduino_device_service._forget_subscriber(subscriber_id)
+
+        self.assertIsNone(arduino_device_service._get_cached_subscriber_id(subscriber_id))
+        self.assertIsNone(arduino_device_service._get_cached_subscriber_id(("document", "12345678000195")))
+
+    def test_concurrent_writes_on_full_cache(self):
+        """
+        Testa que gravações concorrentes com o cache cheio não falham.
+        """
+        errors = []
+
+        def fill():
+            try:
+                for _ in range(2000):
+                    key = uuid4()
+                    arduino_device_service._cache_subscriber_id(key, key)
+            except Exception as e:
+                errors.append(e)
+
+        with mock.patch.object(arduino_device_service, "_SUBSCRIBER_CACHE_MAX_SIZE", 16):
+            threads = [threading.Thread(target=fill) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()